@@ -105,3 +105,51 @@ def test_allowed_hosts_strips_port(mock_handler, mock_context):
     wrapped_handler(mock_context)
 
     mock_handler.assert_called_once_with(mock_context)
+
+
+def test_allowed_hosts_mixed_patterns(mock_handler, mock_context):
+    plugin = AllowedHostsPlugin(allowed_hosts=["example.com", ".test.com"])
+    wrapped_handler = plugin.apply(mock_handler)
+
+    for host in ("example.com", "test.com", "a.b.test.com"):
+        mock_context.host = host
+        wrapped_handler(mock_context)
+
+    for host in ("eviltest.com", "sub.example.com"):
+        mock_context.host = host
+        with pytest.raises(HTTPException):
+            wrapped_handler(mock_context)
+
+    assert mock_handler.call_count == 3
+
+
+def test_allowed_hosts_many_suffix_patterns(mock_handler, mock_context):
+    suffixes = [f".site{i}.com" for i in range(200)]
+    plugin = AllowedHostsPlugin(allowed_hosts=[*suffixes, ".a+b.org"])
+    wrapped_handler = plugin.apply(mock_handler)
+
+    for host in ("www.site199.com", "site7.com", "x.a+b.org"):
+        mock_context.host = host
+        wrapped_handler(mock_context)
+
+    for host in ("www.site200.com", "x.aab.org", "site1xcom"):
+        mock_context.host = host
+        with pytest.raises(HTTPException):
+            wrapped_handler(mock_context)
+
+    assert mock_handler.call_count == 3
+
+
+def test_allowed_hosts_strips_port_from_ipv6(mock_handler, mock_context):
+    plugin = AllowedHostsPlugin(allowed_hosts=["[::1]"])
+    wrapped_handler = plugin.apply(mock_handler)
+
+    for host in ("[::1]:8000", "[::1]"):
+        mock_context.host = host
+        wrapped_handler(mock_context)
+
+    mock_context.host = "[::2]:8000"
+    with pytest.raises(HTTPException):
+        wrapped_handler(mock_context)
+
+    assert mock_handler.call_count == 2
@@ -0,0 +1,59 @@
+from functools import lru_cache
+
+import pytest
+
+from webspark.core import path
+from webspark.core.trierouter import TrieRouter
+from webspark.core.views import View
+
+
+class GetOnlyView(View):
+    def handle_get(self, ctx):
+        return {"action": "get", "args": self.args, "kwargs": self.kwargs}
+
+
+class GetPostView(GetOnlyView):
+    def handle_post(self, ctx):
+        return {"action": "post"}
+
+
+class CustomActionView(View):
+    def custom_get_handler(self, ctx):
+        return {"action": "custom_get"}
+
+    def custom_post_handler(self, ctx):
+        return {"action": "custom_post"}
+
+
+@pytest.fixture(scope="session")
+def get_only_view_func():
+    return GetOnlyView.as_view()
+
+
+@pytest.fixture(scope="session")
+def get_post_view_func():
+    return GetPostView.as_view()
+
+
+@pytest.fixture(scope="session")
+def custom_action_view_func():
+    return CustomActionView.as_view(
+        actions={"get": "custom_get_handler", "post": "custom_post_handler"}
+    )
+
+
+@lru_cache(maxsize=128)
+def _build_router(routes):
+    router = TrieRouter()
+    for pattern, view in routes:
+        router.add_route(path(pattern, view=view))
+    return router
+
+
+@pytest.fixture
+def make_router():
+    """Return a factory building (and caching) a router from (pattern, view) pairs.
+
+    Cached routers are shared between tests, so only use them for lookups.
+    """
+    return _build_router
@@ -1,114 +1,191 @@
+from functools import cache
+
 import pytest
 
 from webspark.core import path
 from webspark.core.trierouter import TrieRouter
 
 
+@cache
 def h(name):
-    return lambda: f"handler:{name}"
+    return lambda _result=f"handler:{name}": _result
+
+
+STATIC_ROUTES = (("/about", h("about")),)
+ROOT_ROUTES = (("/", h("root")),)
+PARAM_ROUTES = (("/users/:id", h("user")),)
+MULTI_PARAM_ROUTES = (("/posts/:year/:slug", h("post")),)
+WILDCARD_ROUTES = (("/files/*path", h("files")),)
+STATIC_PARAM_ROUTES = (("/users/:id/profile", h("profile")),)
+STATIC_WILDCARD_ROUTES = (("/assets/*rest", h("assets")),)
+STATIC_OVER_PARAM_ROUTES = (
+    ("/users/profile", h("static-profile")),
+    ("/users/:id", h("param-user")),
+)
+PARAM_OVER_WILDCARD_ROUTES = (
+    ("/users/:id", h("param-user")),
+    ("/users/*rest", h("wildcard")),
+)
+WILDCARD_ONLY_ROUTES = (("/users/*rest", h("wildcard")),)
+
+PRIORITY_CASES = (
+    (STATIC_OVER_PARAM_ROUTES, "/users/profile", "static-profile", {}),
+    (PARAM_OVER_WILDCARD_ROUTES, "/users/123", "param-user", {"id": "123"}),
+    (WILDCARD_ONLY_ROUTES, "/users/123/settings", "wildcard", {"rest": "123/settings"}),
+)
+
+
+def _bulk_route(i):
+    if i % 3 == 0:
+        return f"/static{i}/page", h(f"static{i}")
+    if i % 3 == 1:
+        return f"/items{i}/:id", h(f"item{i}")
+    return f"/files{i}/*path", h(f"files{i}")
+
+
+def _bulk_case(n):
+    i = n % len(BULK_ROUTES)
+    if i % 3 == 0:
+        return f"/static{i}/page", f"handler:static{i}", {}
+    if i % 3 == 1:
+        return f"/items{i}/{n}", f"handler:item{i}", {"id": str(n)}
+    return f"/files{i}/dir/{n}.txt", f"handler:files{i}", {"path": f"dir/{n}.txt"}
+
+
+BULK_ROUTES = tuple(_bulk_route(i) for i in range(200))
+BULK_CASES = tuple(_bulk_case(n) for n in range(10_000))
+
+
+def new_router():
+    return TrieRouter()
 
 
-@pytest.fixture
-def router():
-    return TrieRouter()
+def test_handler_factory_is_cached():
+    assert h("about") is h("about")
+    assert h("about")() == "handler:about"
 
 
-def test_static_route(router):
-    router.add_route(path("/about", view=h("about")))
-    path_, params = router.search("/about")
+def test_static_route(make_router):
+    path_, params = make_router(STATIC_ROUTES).search("/about")
     assert path_.view() == "handler:about"
     assert params == {}
 
 
-def test_root_route(router):
-    router.add_route(path("/", view=h("root")))
-    path_, params = router.search("/")
+def test_root_route(make_router):
+    path_, params = make_router(ROOT_ROUTES).search("/")
     assert path_.view() == "handler:root"
     assert params == {}
 
 
-def test_param_route(router):
-    router.add_route(path("/users/:id", view=h("user")))
-    path_, params = router.search("/users/42")
+def test_param_route(make_router):
+    path_, params = make_router(PARAM_ROUTES).search("/users/42")
     assert path_.view() == "handler:user"
     assert params == {"id": "42"}
 
 
-def test_multiple_params(router):
-    router.add_route(path("/posts/:year/:slug", view=h("post")))
-    path_, params = router.search("/posts/2025/hello-world")
+def test_multiple_params(make_router):
+    path_, params = make_router(MULTI_PARAM_ROUTES).search("/posts/2025/hello-world")
     assert path_.view() == "handler:post"
     assert params == {"year": "2025", "slug": "hello-world"}
 
 
-def test_wildcard_route(router):
-    router.add_route(path("/files/*path", view=h("files")))
-    path_, params = router.search("/files/images/2025/logo.png")
+def test_wildcard_route(make_router):
+    path_, params = make_router(WILDCARD_ROUTES).search("/files/images/2025/logo.png")
     assert path_.view() == "handler:files"
     assert params == {"path": "images/2025/logo.png"}
 
 
-def test_wildcard_empty_tail(router):
-    router.add_route(path("/files/*path", view=h("files")))
-    path_, params = router.search("/files")
+def test_wildcard_empty_tail(make_router):
+    path_, params = make_router(WILDCARD_ROUTES).search("/files")
     assert path_.view() == "handler:files"
     assert params == {"path": ""}
 
 
-def test_mixed_static_and_param(router):
-    router.add_route(path("/users/:id/profile", view=h("profile")))
-    path_, params = router.search("/users/123/profile")
+def test_mixed_static_and_param(make_router):
+    path_, params = make_router(STATIC_PARAM_ROUTES).search("/users/123/profile")
     assert path_.view() == "handler:profile"
     assert params == {"id": "123"}
 
 
-def test_mixed_static_and_wildcard(router):
-    router.add_route(path("/assets/*rest", view=h("assets")))
-    path_, params = router.search("/assets/css/styles/main.css")
+def test_mixed_static_and_wildcard(make_router):
+    path_, params = make_router(STATIC_WILDCARD_ROUTES).search(
+        "/assets/css/styles/main.css"
+    )
     assert path_.view() == "handler:assets"
     assert params == {"rest": "css/styles/main.css"}
 
 
-def test_priority_static_over_param(router):
-    router.add_route(path("/users/profile", view=h("static-profile")))
-    router.add_route(path("/users/:id", view=h("param-user")))
-    path_, params = router.search("/users/profile")
-    assert path_.view() == "handler:static-profile"
-    assert params == {}
+@pytest.mark.parametrize(
+    ("routes", "query", "expected", "expected_params"),
+    PRIORITY_CASES,
+    ids=["static-over-param", "param-over-wildcard", "wildcard-fallback"],
+)
+def test_priority(make_router, routes, query, expected, expected_params):
+    path_, params = make_router(routes).search(query)
+    assert path_.view() == f"handler:{expected}"
+    assert params == expected_params
 
 
-def test_priority_param_over_wildcard(router):
-    router.add_route(path("/users/:id", view=h("param-user")))
-    router.add_route(path("/users/*rest", view=h("wildcard")))
-    path_, params = router.search("/users/123")
-    assert path_.view() == "handler:param-user"
-    assert params == {"id": "123"}
+def test_bulk_search_consistency(make_router):
+    search = make_router(BULK_ROUTES).search
 
+    results = [search(url) for url, _, _ in BULK_CASES]
 
-def test_priority_wildcard_when_no_other_match(router):
-    router.add_route(path("/users/*rest", view=h("wildcard")))
-    path_, params = router.search("/users/123/settings")
-    assert path_.view() == "handler:wildcard"
-    assert params == {"rest": "123/settings"}
+    for (path_, params), (url, expected, expected_params) in zip(
+        results, BULK_CASES, strict=True
+    ):
+        assert path_ is not None, url
+        assert path_.view() == expected
+        assert params == expected_params
 
 
-def test_duplicate_param_same_route(router):
+def test_duplicate_param_same_route():
+    router = new_router()
     with pytest.raises(ValueError, match="Duplicate parameter name 'id'"):
         router.add_route(path("/users/:id/profile/:id", view=h("dup")))
 
 
-def test_param_and_wildcard_same_name(router):
+def test_param_and_wildcard_same_name():
+    router = new_router()
     with pytest.raises(ValueError, match="Duplicate parameter name 'path'"):
         router.add_route(path("/files/:path/*path", view=h("bad")))
 
 
-def test_conflicting_param_names_same_position(router):
+def test_conflicting_param_names_same_position():
+    router = new_router()
     router.add_route(path("/users/:id", view=h("user")))
     with pytest.raises(ValueError, match="Conflicting param names"):
         router.add_route(path("/users/:user_id", view=h("user2")))
 
 
-def test_conflicting_wildcard_names(router):
+def test_conflicting_wildcard_names():
+    router = new_router()
     router.add_route(path("/media/*path", view=h("media")))
     with pytest.raises(ValueError, match="Conflicting wildcard names"):
         router.add_route(path("/media/*rest", view=h("media2")))
+
+
+def test_routes_keep_insertion_order():
+    router = new_router()
+    about = path("/about", view=h("about"))
+    files = path("/files/*path", view=h("files"))
+    router.add_route(about)
+    router.add_route(files)
+
+    with pytest.raises(ValueError):
+        router.add_route(path("/files/*rest", view=h("files2")))
+
+    assert router.routes == [about, files]
+
+
+def test_static_routes_lookup():
+    router = new_router()
+    about = path("/about", view=h("about"))
+    user = path("/users/:id", view=h("user"))
+    router.add_route(about)
+    router.add_route(user)
+
+    assert router.static_routes == {"/about": about, "/about/": about}
+    assert router.search("/about/") == (about, {})
+    assert router.search("//about") == (about, {})
+    assert router.search("/users/:id") == (user, {"id": ":id"})
@@ -1,30 +1,34 @@
+from dataclasses import dataclass, field
+from typing import Any
+
 import pytest
 
 from webspark.core.views import DEFAULT_ACTIONS, View
+from webspark.utils import HTTPException
 
 
+@dataclass(slots=True)
 class MockContext:
-    def __init__(self, method="GET", query_params=None, body=None, env=None):
-        self.method = method
-        self.query_params = query_params or {}
-        self.body = body or {}
-        self.environ = env or {}
-        self.args = ()
-        self.kwargs = {}
+    method: str = "GET"
+    query_params: dict = field(default_factory=dict)
+    body: dict = field(default_factory=dict)
+    environ: dict = field(default_factory=dict)
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
 
 
+@dataclass(slots=True)
 class MockResponse:
-    def __init__(self, data="response"):
-        self.data = data
+    data: Any = "response"
 
 
+@dataclass(slots=True)
 class MockSchema:
-    def __init__(self, data=None, context=None):
-        self.data = data
-        self.context = context or {}
-        self._is_valid = True
-        self._validated_data = {"validated": True}
-        self._errors = {}
+    data: Any = None
+    context: dict = field(default_factory=dict)
+    _is_valid: bool = True
+    _validated_data: dict = field(default_factory=lambda: {"validated": True})
+    _errors: dict = field(default_factory=dict)
 
     def is_valid(self):
         return self._is_valid
@@ -38,6 +42,13 @@ class MockSchema:
         return self._errors
 
 
+# Shared contexts for tests that never mutate them. Tests that go through a view
+# function (which writes to ctx.environ) or assert on the ctx setter build their own.
+EMPTY_CTX = MockContext()
+GET_CTX = MockContext(method="get")
+POST_CTX = MockContext(method="post")
+
+
 def test_view_default_actions():
     assert "get" in DEFAULT_ACTIONS
     assert DEFAULT_ACTIONS["get"] == "handle_get"
@@ -46,6 +57,14 @@ def test_view_default_actions():
     assert len(DEFAULT_ACTIONS) == 9
 
 
+def test_view_public_surface():
+    names = {"as_view", "dispatch", "build_ctx"}
+
+    assert names <= set(vars(View))
+    assert all(callable(getattr(View, name)) for name in names)
+    assert isinstance(vars(View)["ctx"], property)
+
+
 def test_view_property():
     view = View()
     ctx = MockContext()
@@ -55,15 +74,8 @@ def test_view_property():
     assert view.__ctx__ is ctx
 
 
-def test_view_as_view_default_actions():
-    class TestView(View):
-        def handle_get(self, request):
-            return MockResponse("get_response")
-
-        def handle_post(self, request):
-            return MockResponse("post_response")
-
-    view_func = TestView.as_view()
+def test_view_as_view_default_actions(get_post_view_func):
+    view_func = get_post_view_func
 
     assert callable(view_func)
     assert hasattr(view_func, "http_methods")
@@ -72,17 +84,8 @@ def test_view_as_view_default_actions():
     assert "head" in view_func.http_methods
 
 
-def test_view_as_view_custom_actions():
-    class TestView(View):
-        def custom_get_handler(self, request):
-            return MockResponse("custom_get")
-
-        def custom_post_handler(self, request):
-            return MockResponse("custom_post")
-
-    actions = {"get": "custom_get_handler", "post": "custom_post_handler"}
-
-    view_func = TestView.as_view(actions=actions)
+def test_view_as_view_custom_actions(custom_action_view_func):
+    view_func = custom_action_view_func
 
     assert callable(view_func)
     assert hasattr(view_func, "http_methods")
@@ -90,6 +93,9 @@ def test_view_as_view_custom_actions():
     assert "post" in view_func.http_methods
     assert "head" in view_func.http_methods
 
+    assert view_func(MockContext(method="get")) == {"action": "custom_get"}
+    assert view_func(MockContext(method="post")) == {"action": "custom_post"}
+
 
 def test_view_as_view_no_actions():
     class TestView(View):
@@ -120,7 +126,7 @@ def test_view_dispatch():
 
     view = TestView()
     view.action_map = {"get": "handle_get"}
-    ctx = MockContext(method="get")
+    ctx = GET_CTX
 
     response = view.dispatch(ctx, "arg1", "arg2", kwarg1="value1")
 
@@ -138,7 +144,7 @@ def test_view_dispatch_with_custom_action():
 
     view = TestView()
     view.action_map = {"post": "custom_handler"}
-    request = MockContext(method="post")
+    request = POST_CTX
 
     response = view.dispatch(request)
 
@@ -150,7 +156,7 @@ def test_view_build_ctx():
     view = View()
     view.args = ("arg1", "arg2")
     view.kwargs = {"kwarg1": "value1"}
-    view.ctx = MockContext()
+    view.ctx = EMPTY_CTX
 
     ctx = view.build_ctx()
 
@@ -161,91 +167,59 @@ def test_view_build_ctx():
     assert ctx["ctx"] is view.ctx
 
 
-def test_view_as_view_function_attributes():
-    class TestView(View):
-        def handle_get(self, request):
-            return MockResponse("get_response")
-
-    view_func = TestView.as_view()
+def test_view_as_view_function_attributes(get_only_view_func):
+    view_func = get_only_view_func
 
     assert hasattr(view_func, "__name__")
     assert hasattr(view_func, "http_methods")
     assert "get" in view_func.http_methods
 
 
-def test_view_as_view_update_wrapper():
-    class TestView(View):
-        def handle_get(self, request):
-            return MockResponse("get_response")
-
-    view_func = TestView.as_view()
+def test_view_as_view_update_wrapper(get_only_view_func):
+    view_func = get_only_view_func
 
     assert hasattr(view_func, "http_methods")
+    assert view_func.__name__ == "GetOnlyView"
 
 
-def test_view_validate_schema_integration():
-    class SchemaView(View):
-        def handle_get(self, request):
-            self.args = ()
-            self.kwargs = {}
-            return MockResponse("success")
-
-        def handle_post(self, request):
-            self.args = ()
-            self.kwargs = {}
-            return MockResponse("success")
-
-    view_func = SchemaView.as_view()
+def test_view_validate_schema_integration(get_post_view_func):
+    view_func = get_post_view_func
     env = {}
-    request = MockContext(method="get", env=env)
+    request = MockContext(method="get", environ=env)
 
     response = view_func(request)
-    assert isinstance(response, MockResponse)
-    assert response.data == "success"
+    assert response["action"] == "get"
 
     request = MockContext(method="post")
     response = view_func(request)
-    assert isinstance(response, MockResponse)
-    assert response.data == "success"
+    assert response["action"] == "post"
 
 
-def test_view_full_integration():
-    class UserView(View):
-        def handle_get(self, request):
-            return MockResponse({"action": "get"})
-
-        def handle_post(self, request):
-            return MockResponse({"action": "post"})
-
-    view_func = UserView.as_view()
+def test_view_full_integration(get_post_view_func):
+    view_func = get_post_view_func
     env = {}
-    request = MockContext(method="get", env=env)
+    request = MockContext(method="get", environ=env)
 
     response = view_func(request)
-    assert isinstance(response, MockResponse)
-    assert response.data["action"] == "get"
+    assert response["action"] == "get"
+    assert env["webspark.view_instance"].ctx is request
 
     request = MockContext(method="post")
     response = view_func(request)
-    assert isinstance(response, MockResponse)
-    assert response.data["action"] == "post"
+    assert response["action"] == "post"
 
 
-def test_view_dispatch_sets_attributes():
-    class TestView(View):
-        def handle_get(self, ctx):
-            assert hasattr(self, "args")
-            assert hasattr(self, "kwargs")
-            assert hasattr(self, "ctx")
-            return MockResponse("success")
-
-    view_func = TestView.as_view()
+def test_view_dispatch_sets_attributes(get_only_view_func):
     env = {}
-    request = MockContext(method="get", env=env)
+    request = MockContext(method="get", environ=env)
 
-    response = view_func(request)
-    assert isinstance(response, MockResponse)
-    assert response.data == "success"
+    response = get_only_view_func(request)
+    view = env["webspark.view_instance"]
+
+    assert response == {"action": "get", "args": (), "kwargs": {}}
+    assert view.args == ()
+    assert view.kwargs == {}
+    assert view.ctx is request
 
 
 def test_view_as_view_with_initkwargs():
@@ -260,35 +234,15 @@ def test_view_as_view_with_initkwargs():
     view_func = TestView.as_view(custom_param="test_value")
 
     env = {}
-    request = MockContext(method="get", env=env)
+    request = MockContext(method="get", environ=env)
 
     response = view_func(request)
 
     assert isinstance(response, MockResponse)
 
 
-def test_view_as_view_with_hasattr_check():
-    class TestView(View):
-        def handle_get(self, request):
-            return MockResponse("get_response")
-
-        def handle_post(self, request):
-            return MockResponse("post_response")
-
-    view_func = TestView.as_view()
-
-    assert callable(view_func)
-    assert hasattr(view_func, "http_methods")
-    assert "get" in view_func.http_methods
-    assert "post" in view_func.http_methods
-
-
-def test_view_as_view_no_actions_default_behavior():
-    class TestView(View):
-        def handle_get(self, request):
-            return MockResponse("get_response")
-
-    view_func = TestView.as_view()
+def test_view_as_view_no_actions_default_behavior(get_only_view_func):
+    view_func = get_only_view_func
 
     assert callable(view_func)
     assert hasattr(view_func, "http_methods")
@@ -336,7 +290,7 @@ def test_view_request_setter():
 
 def test_view_request_property_getter():
     view = View()
-    ctx = MockContext()
+    ctx = EMPTY_CTX
 
     view.__ctx__ = ctx
     assert view.ctx is ctx
@@ -348,7 +302,7 @@ def test_view_dispatch_handler_not_found():
 
     view = TestView()
     view.action_map = {"get": "nonexistent_handler"}
-    request = MockContext(method="get")
+    request = GET_CTX
 
     with pytest.raises(AttributeError):
         view.dispatch(request)
@@ -358,7 +312,7 @@ def test_view_build_ctx_with_empty_args():
     view = View()
     view.args = ()
     view.kwargs = {}
-    view.ctx = MockContext()
+    view.ctx = EMPTY_CTX
 
     ctx = view.build_ctx()
 
@@ -371,9 +325,44 @@ def test_view_build_ctx_with_populated_args():
     view = View()
     view.args = ("arg1", "arg2")
     view.kwargs = {"kwarg1": "value1", "kwarg2": "value2"}
-    view.ctx = MockContext()
+    view.ctx = EMPTY_CTX
 
     ctx = view.build_ctx()
 
     assert ctx["args"] == ("arg1", "arg2")
     assert ctx["kwargs"] == {"kwarg1": "value1", "kwarg2": "value2"}
+
+
+def test_view_as_view_cached_on_class():
+    class ParentView(View):
+        def handle_get(self, ctx):
+            return "parent"
+
+    class ChildView(ParentView):
+        def handle_post(self, ctx):
+            return "child"
+
+    view_func = ParentView.as_view()
+
+    assert ParentView.as_view() is view_func
+    assert ChildView.as_view() is not view_func
+    assert "post" in ChildView.as_view().http_methods
+    assert ParentView.as_view(actions={"get": "handle_get"}) is not view_func
+
+
+def test_view_as_view_handler_resolution():
+    class MixedView(View):
+        def handle_get(self, ctx):
+            return ("get", self.args)
+
+        @staticmethod
+        def handle_post(ctx):
+            return "post"
+
+    view_func = MixedView.as_view()
+
+    assert view_func(GET_CTX) == ("get", ())
+    assert view_func(POST_CTX) == "post"
+    with pytest.raises(HTTPException) as exc_info:
+        view_func(MockContext(method="delete"))
+    assert exc_info.value.status_code == 405
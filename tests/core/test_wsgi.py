@@ -3,7 +3,7 @@ from unittest.mock import Mock
 from webspark.core.trierouter import path
 from webspark.core.views import View
 from webspark.core.wsgi import WebSpark
-from webspark.http.context import Context
+from webspark.http.context import _LAZY_SLOTS, _UNSET, Context
 from webspark.utils.exceptions import HTTPException
 
 
@@ -82,3 +82,64 @@ def test_custom_exception_handler():
 
     assert start_response.status.startswith("404 Not Found")
     assert response_body == b"Custom Not Found"
+
+
+def test_not_found_leaves_request_attributes_unparsed():
+    app = WebSpark()
+    seen = []
+
+    @app.handle_exception(404)
+    def custom_404_handler(ctx, exc):
+        seen.append(ctx)
+        ctx.text("Custom Not Found", status=404)
+
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/not-found",
+        "QUERY_STRING": "a=1",
+        "HTTP_HOST": "test.com",
+        "HTTP_COOKIE": "session=abc",
+        "wsgi.errors": Mock(),
+    }
+    app(environ, StartResponseMock())
+
+    (ctx,) = seen
+    computed = {
+        name for name, slot in _LAZY_SLOTS.items() if getattr(ctx, slot) is not _UNSET
+    }
+    assert computed == {"path"}
+
+
+def test_handle_exception_returns_handler():
+    app = WebSpark()
+
+    @app.handle_exception(404)
+    def not_found(ctx, exc):
+        pass
+
+    @app.handle_exception(999)
+    def unknown(ctx, exc):
+        pass
+
+    assert app.exceptions == {404: not_found, 999: unknown}
+
+
+def test_exception_handler_assigned_through_exceptions_dict():
+    app = WebSpark()
+
+    def not_found(ctx, exc):
+        ctx.text("Custom Not Found", status=404)
+
+    app.exceptions[404] = not_found
+
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/not-found",
+        "HTTP_HOST": "test.com",
+        "wsgi.errors": Mock(),
+    }
+    assert b"".join(app(environ, StartResponseMock())) == b"Custom Not Found"
+
+    del app.exceptions[404]
+
+    assert b"".join(app(environ, StartResponseMock())) != b"Custom Not Found"
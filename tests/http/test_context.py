@@ -2,11 +2,15 @@ import io
 import json
 import os
 import tempfile
+from http import HTTPStatus
 from unittest.mock import patch
+from wsgiref.util import FileWrapper
 
 import pytest
 
-from webspark.http.context import Context
+from webspark.constants import STATUS_CODE
+from webspark.core.plugin import Plugin
+from webspark.http.context import _UNSET, Context, _http_date, _mimetype_for_ext
 from webspark.utils import HTTPException
 
 
@@ -89,6 +93,13 @@ def test_query_params_empty(mock_environ):
     assert context.query_params == {}
 
 
+def test_query_params_repeated_keys(mock_environ):
+    """Test repeated query keys are collected into a list."""
+    mock_environ["QUERY_STRING"] = "tag=a&page=2&tag=b&tag=c&empty="
+    context = Context(mock_environ)
+    assert context.query_params == {"tag": ["a", "b", "c"], "page": "2", "empty": ""}
+
+
 def test_query_params_malformed(mock_environ):
     """Test malformed query string handling."""
     mock_environ["QUERY_STRING"] = "invalid%query&string%"
@@ -128,6 +139,17 @@ def test_cookies_parsing(context: Context):
     assert cookies["user"] == "john"
 
 
+def test_get_cookie(context: Context):
+    """Test single cookie lookup, before and after full parsing."""
+    assert context.get_cookie("user") == "john"
+    assert context.get_cookie("missing") is None
+    assert context.get_cookie("missing", "guest") == "guest"
+    assert context._request_cookies is _UNSET
+
+    assert context.cookies["session"] == "abc123"
+    assert context.get_cookie("session") == "abc123"
+
+
 def test_content_type_parsing(context):
     """Test content type parsing."""
     assert context.content_type == "application/json"
@@ -142,17 +164,70 @@ def test_charset_detection_custom(context):
     """Test custom charset detection."""
     context.environ["CONTENT_TYPE"] = "text/html; charset=iso-8859-1"
     # Reset cached property
-    context.__dict__.pop("charset", None)
+    context.invalidate("charset")
     assert context.charset == "iso-8859-1"
 
 
 def test_content_length_valid(context):
     """Test valid content length."""
     context.environ["CONTENT_LENGTH"] = "100"
-    context.__dict__.pop("content_length", None)
+    context.invalidate("content_length")
     assert context.content_length == 100
 
 
+def test_invalidate_lazy_attribute(context):
+    """Test lazy attributes are cached until invalidated."""
+    assert context.method == "get"
+    context.environ["REQUEST_METHOD"] = "POST"
+    assert context.method == "get"
+
+    context.invalidate("method")
+    assert context.method == "post"
+
+    with pytest.raises(AttributeError):
+        context.invalidate("status")
+
+
+def test_context_has_no_instance_dict(context):
+    """Test Context stores its state in slots."""
+    assert not hasattr(context, "__dict__")
+
+
+def test_context_initializes_every_slot(context):
+    """Test every slot is set in __init__, so none needs a getattr default."""
+    assert [slot for slot in Context.__slots__ if not hasattr(context, slot)] == []
+    assert context.path_params == {}
+
+
+def test_context_stream_state_defaults(context):
+    """Test streaming attributes start unset and are cleared on reset."""
+    assert context.chunk_size is None
+    assert context.range_header is None
+    assert context.file_path is None
+
+    context.stream([b"chunk"])
+    context.reset_response()
+    context.text("done")
+
+    assert context.chunk_size is None
+    assert context.as_wsgi()[2] == (b"done",)
+
+
+def test_content_length_empty(mock_environ):
+    """Test an empty Content-Length is treated as zero."""
+    mock_environ["CONTENT_LENGTH"] = ""
+    context = Context(mock_environ)
+    assert context.content_length == 0
+
+
+@pytest.mark.parametrize("value", ["1e3", "+5", "5.0", "²", "0x10"])
+def test_content_length_non_decimal(mock_environ, value):
+    """Test non-decimal Content-Length values are treated as zero."""
+    mock_environ["CONTENT_LENGTH"] = value
+    context = Context(mock_environ)
+    assert context.content_length == 0
+
+
 def test_content_length_invalid(mock_environ):
     """Test invalid content length handling."""
     mock_environ["CONTENT_LENGTH"] = "invalid"
@@ -185,6 +260,26 @@ def test_body_parsing_json(mock_environ):
     assert context.body == test_data
 
 
+def test_body_parsing_json_passes_raw_bytes(mock_environ):
+    """Test the raw JSON body bytes are handed to the decoder undecoded."""
+    json_data = json.dumps({"name": "João"}, ensure_ascii=False).encode()
+    mock_environ.update(
+        {
+            "REQUEST_METHOD": "POST",
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": str(len(json_data)),
+            "wsgi.input": io.BytesIO(json_data),
+        }
+    )
+
+    context = Context(mock_environ)
+    with patch(
+        "webspark.http.context.deserialize_json", side_effect=json.loads
+    ) as deserialize:
+        assert context.body == {"name": "João"}
+    deserialize.assert_called_once_with(json_data)
+
+
 def test_body_parsing_form_urlencoded(mock_environ):
     """Test form URL-encoded body parsing."""
     form_data = "name=John&age=30&tags=python&tags=web"
@@ -221,6 +316,17 @@ def test_body_parsing_empty_json(mock_environ):
     assert context.body == {}
 
 
+def test_body_empty_skips_content_checks(mock_environ):
+    """Test a body method without content returns an empty body right away."""
+    mock_environ.update({"REQUEST_METHOD": "POST", "CONTENT_LENGTH": "0"})
+    del mock_environ["CONTENT_TYPE"]
+    stream = mock_environ["wsgi.input"] = io.BytesIO(b"ignored")
+
+    context = Context(mock_environ)
+    assert context.body == {}
+    assert stream.tell() == 0
+
+
 def test_body_invalid_method(context):
     """Test body access with invalid method."""
     with pytest.raises(HTTPException) as exc_info:
@@ -246,6 +352,47 @@ def test_body_too_large(mock_environ):
     assert exc_info.value.status_code == 413
 
 
+def test_body_read_in_chunks(mock_environ):
+    """Test the body is read in BUF_READ_SIZE chunks."""
+    json_data = json.dumps({"name": "John", "tags": ["a", "b"]}).encode()
+    stream = io.BytesIO(json_data)
+    mock_environ.update(
+        {
+            "REQUEST_METHOD": "POST",
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": str(len(json_data)),
+            "wsgi.input": stream,
+        }
+    )
+    mock_environ["webspark.instance"].config.BUF_READ_SIZE = 4
+
+    context = Context(mock_environ)
+    with patch.object(stream, "read", wraps=stream.read) as read:
+        assert context.body == {"name": "John", "tags": ["a", "b"]}
+    assert all(call.args[0] <= 4 for call in read.call_args_list)
+    assert read.call_count > 1
+
+
+def test_body_too_large_without_content_length(mock_environ):
+    """Test terminated input without Content-Length is rejected while reading."""
+    mock_environ.update(
+        {
+            "REQUEST_METHOD": "POST",
+            "CONTENT_TYPE": "application/json",
+            "wsgi.input": io.BytesIO(b"x" * 1000),
+            "wsgi.input_terminated": True,
+        }
+    )
+    mock_environ["webspark.instance"].config.MAX_BODY_SIZE = 100
+    mock_environ["webspark.instance"].config.BUF_READ_SIZE = 64
+
+    context = Context(mock_environ)
+    with pytest.raises(HTTPException) as exc_info:
+        _ = context.body
+    assert exc_info.value.status_code == 413
+    assert mock_environ["wsgi.input"].tell() == 128
+
+
 def test_body_missing_content_type(mock_environ):
     """Test body access without content type."""
     mock_environ.update(
@@ -334,13 +481,23 @@ def test_proxy_trust_disabled(context):
     context.environ["HTTP_X_FORWARDED_PROTO"] = "https"
 
     # Reset cached properties
-    context.__dict__.pop("ip", None)
-    context.__dict__.pop("scheme", None)
+    context.invalidate("ip")
+    context.invalidate("scheme")
 
     assert context.ip == "127.0.0.1"  # Uses REMOTE_ADDR
     assert context.scheme == "https"  # Uses wsgi.url_scheme
 
 
+def test_scheme_without_proxy_trust_skips_headers(mock_environ):
+    """Test scheme and is_secure read wsgi.url_scheme directly without proxy trust."""
+    mock_environ["HTTP_X_FORWARDED_PROTO"] = "http"
+    context = Context(mock_environ)
+
+    assert context.is_secure is True
+    assert context.scheme == "https"
+    assert context._headers is _UNSET
+
+
 def test_proxy_trust_enabled(context):
     """Test proxy headers when trust is enabled."""
     context.webspark.config.TRUST_PROXY = True
@@ -348,8 +505,8 @@ def test_proxy_trust_enabled(context):
     context.environ["HTTP_X_FORWARDED_PROTO"] = "http"
 
     # Reset cached properties
-    context.__dict__.pop("ip", None)
-    context.__dict__.pop("scheme", None)
+    context.invalidate("ip")
+    context.invalidate("scheme")
 
     assert context.ip == "192.168.1.1"
     assert context.scheme == "http"
@@ -435,6 +592,24 @@ def test_error_response(context):
     assert context.get_header("content-type") == "application/json; charset=utf-8"
 
 
+def test_error_response_encoding(context):
+    """Test error responses encode to the same JSON as their body."""
+    context.error('Bad "input"', HTTPStatus.BAD_REQUEST)
+
+    (body,) = context.as_wsgi()[2]
+    assert json.loads(body) == {"error": 'Bad "input"', "status": 400}
+    assert json.loads(body) == context.response_body
+
+
+def test_error_response_body_mutation_is_sent(context):
+    """Test in-place changes to an error body made before as_wsgi are sent."""
+    context.error("Not found", 404)
+    context.response_body["path"] = "/missing"
+
+    (body,) = context.as_wsgi()[2]
+    assert json.loads(body) == {"error": "Not found", "status": 404, "path": "/missing"}
+
+
 def test_error_response_default_status(context):
     """Test error response with default status."""
     context.error("Internal Error")
@@ -484,6 +659,24 @@ def test_response_state_tracking(context):
     assert context.responded is True
 
 
+def test_response_cookie_and_header_case_storage_is_lazy(context):
+    """Test cookie and header-case storage is only allocated when used."""
+    context.text("plain")
+    assert context._cookies == ()
+    assert context._header_case is None
+
+    context.set_cookie("a", "1")
+    context.set_cookie("b", "2")
+    context.set_header("X-Custom", "value")
+    assert len(context._cookies) == 2
+    assert context._header_case == {"x-custom": "X-Custom"}
+
+    context.reset_response()
+    assert context._cookies == ()
+    assert context._header_case is None
+    context.delete_header("x-custom")
+
+
 def test_response_reset(context):
     """Test response reset functionality."""
     context.json({"test": "data"})
@@ -503,6 +696,26 @@ def test_response_reset(context):
     assert len(context._cookies) == 0
 
 
+@pytest.mark.parametrize("file_wrapper", [None, FileWrapper])
+def test_response_reset_closes_streamed_file(context, file_wrapper):
+    """Test resetting the response closes a file opened by stream()."""
+    if file_wrapper is not None:
+        context.environ["wsgi.file_wrapper"] = file_wrapper
+    with tempfile.NamedTemporaryFile() as tmp:
+        tmp.write(b"0123456789")
+        tmp.flush()
+
+        context.stream(tmp.name)
+        f = context._stream_file
+        assert not f.closed
+
+        context.reset_response()
+
+        assert f.closed
+        assert context._stream_file is None
+        assert context.response_body == b""
+
+
 def test_assert_not_responded_success(context):
     """Test assertion when not responded."""
     context.assert_not_responded()  # Should not raise
@@ -527,7 +740,7 @@ def test_stream_bytes_basic(context):
     context.stream(data)
 
     assert context.status == 200
-    assert context.response_body == [data]
+    assert context.response_body == (data,)
     assert context.get_header("content-length") == str(len(data))
     assert context.get_header("accept-ranges") == "bytes"
 
@@ -539,7 +752,7 @@ def test_stream_bytes_with_range(context):
     context.stream(data)
 
     assert context.status == 206
-    assert context.response_body == [b"Hello"]
+    assert context.response_body == (b"Hello",)
     assert "content-range" in context.response_headers
     assert context.response_headers["content-range"] == "bytes 0-4/29"
 
@@ -559,6 +772,36 @@ def test_stream_file_not_found(context):
     assert exc_info.value.status_code == 404
 
 
+def test_stream_file_not_regular(context, tmp_path):
+    """Test streaming a directory or FIFO is treated as missing."""
+    with pytest.raises(HTTPException) as exc_info:
+        context.stream(str(tmp_path))
+    assert exc_info.value.status_code == 404
+
+    if hasattr(os, "mkfifo"):
+        fifo = tmp_path / "fifo"
+        os.mkfifo(fifo)
+        with pytest.raises(HTTPException) as exc_info:
+            context.stream(fifo)
+        assert exc_info.value.status_code == 404
+
+
+def test_stream_file_single_open(context, tmp_path):
+    """Test a streamed file is opened once and stat'ed through its descriptor."""
+    file = tmp_path / "data.bin"
+    file.write_bytes(b"0123456789")
+
+    with (
+        patch("os.open", wraps=os.open) as os_open,
+        patch("os.stat", wraps=os.stat) as os_stat,
+    ):
+        context.stream(file, chunk_size=4)
+        assert b"".join(context.response_body) == b"0123456789"
+
+    os_open.assert_called_once()
+    assert all(call.args[0] != str(file) for call in os_stat.call_args_list)
+
+
 def test_stream_file_success(context):
     """Test streaming existing file."""
     with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as tmp:
@@ -586,6 +829,14 @@ def test_stream_file_success(context):
             os.unlink(tmp.name)
 
 
+def test_http_date_is_cached_per_second():
+    """Test HTTP dates are formatted once per whole-second timestamp."""
+    _http_date.cache_clear()
+    assert _http_date(0) == "Thu, 01 Jan 1970 00:00:00 GMT"
+    assert _http_date(0) == "Thu, 01 Jan 1970 00:00:00 GMT"
+    assert _http_date.cache_info().hits == 1
+
+
 def test_stream_file_with_range(context):
     """Test streaming file with range header."""
     with tempfile.NamedTemporaryFile(delete=False) as tmp:
@@ -609,6 +860,79 @@ def test_stream_file_with_range(context):
             os.unlink(tmp.name)
 
 
+class GetItemFileWrapper:
+    """File wrapper defining only __getitem__, like gunicorn's FileWrapper."""
+
+    def __init__(self, filelike, blksize=8192):
+        self.filelike = filelike
+        self.blksize = blksize
+        self.close = filelike.close
+
+    def __getitem__(self, key):
+        data = self.filelike.read(self.blksize)
+        if data:
+            return data
+        raise IndexError
+
+
+def test_stream_file_wrapper_without_iter_is_passed_through(context):
+    """Test that a non-iterable server file wrapper reaches the server as is."""
+    context.environ["wsgi.file_wrapper"] = GetItemFileWrapper
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        test_content = b"0123456789" * 10
+        tmp.write(test_content)
+        tmp.flush()
+
+        try:
+            context.stream(tmp.name)
+            context.set_cookie("session", "abc")
+            status, headers, body = context.as_wsgi()
+
+            assert body is context.response_body
+            assert isinstance(body, GetItemFileWrapper)
+            assert ("content-length", "100") in headers
+            assert any(name == "Set-Cookie" for name, _ in headers)
+            assert not hasattr(body, "__iter__")
+            assert b"".join(body) == test_content
+            body.close()
+        finally:
+            os.unlink(tmp.name)
+
+    context.reset_response()
+    context.response_body = b"ok"
+    assert context.as_wsgi()[2] == (b"ok",)
+
+
+def test_stream_file_uses_file_wrapper(context):
+    """Test streaming a file through the server's wsgi.file_wrapper."""
+    context.environ["wsgi.file_wrapper"] = FileWrapper
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        test_content = b"0123456789" * 10
+        tmp.write(test_content)
+        tmp.flush()
+
+        try:
+            context.stream(tmp.name)
+            assert isinstance(context.response_body, FileWrapper)
+            assert b"".join(context.response_body) == test_content
+            context.response_body.close()
+
+            context.headers["range"] = "bytes=90-"
+            context.stream(tmp.name)
+            assert context.status == 206
+            assert isinstance(context.response_body, FileWrapper)
+            assert b"".join(context.response_body) == test_content[90:]
+            context.response_body.close()
+
+            context.headers["range"] = "bytes=10-19"
+            context.stream(tmp.name)
+            assert not isinstance(context.response_body, FileWrapper)
+            assert b"".join(context.response_body) == test_content[10:20]
+
+        finally:
+            os.unlink(tmp.name)
+
+
 def test_stream_file_no_permission():
     """Test streaming file without read permission."""
     with tempfile.NamedTemporaryFile(delete=False) as tmp:
@@ -701,6 +1025,23 @@ def test_parse_range_out_of_bounds(context):
     assert exc_info.value.status_code == 416
 
 
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [("Bytes = 10 - 20", (10, 20)), ("bytes=-", (0, 99)), ("bytes=90-120", (90, 99))],
+)
+def test_parse_range_lenient_forms(context, header, expected):
+    """Test range headers with whitespace, case and open bounds."""
+    assert context._parse_range(header, 100) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=0-1,5-6", "bytes=+1-2", "bytes", "=1-2"])
+def test_parse_range_rejects_unsupported(context, header):
+    """Test multi-range and malformed range headers are rejected."""
+    with pytest.raises(HTTPException) as exc_info:
+        context._parse_range(header, 100)
+    assert exc_info.value.status_code == 416
+
+
 def test_mime_type_detection_json(context):
     """Test JSON MIME type detection."""
     mime_type = context._detect_stream_mimetype("test.json", None)
@@ -731,12 +1072,37 @@ def test_mime_type_detection_javascript_charset(context):
     assert "charset=utf-8" in mime_type
 
 
+@pytest.mark.parametrize("filename", ["icon.svg", "feed.xml"])
+def test_mime_type_detection_textual_charset(context, filename):
+    """Test charset addition for textual non-text/* types."""
+    mime_type = context._detect_stream_mimetype(filename, None)
+    assert mime_type.endswith("; charset=utf-8")
+
+
 def test_mime_type_detection_gzip_encoding(context):
     """Test gzip encoding detection."""
     mime_type = context._detect_stream_mimetype("test.tar.gz", None)
     assert mime_type == "application/gzip"
 
 
+def test_mime_type_detection_cached_per_extension(context):
+    """Test MIME types are guessed once per extension and charset."""
+    _mimetype_for_ext.cache_clear()
+    with patch("mimetypes.guess_type", return_value=("text/css", None)) as guess:
+        assert context._detect_stream_mimetype("a/site.css", None) == (
+            "text/css; charset=utf-8"
+        )
+        assert context._detect_stream_mimetype("b/print.css", None) == (
+            "text/css; charset=utf-8"
+        )
+        context.response_charset = "latin-1"
+        assert context._detect_stream_mimetype("site.css", None) == (
+            "text/css; charset=latin-1"
+        )
+    assert guess.call_count == 2
+    _mimetype_for_ext.cache_clear()
+
+
 # ===========================================
 # CONVENIENCE METHODS TESTS
 # ===========================================
@@ -751,7 +1117,7 @@ def test_is_ajax_true(context):
     """Test AJAX detection when is AJAX."""
     context.environ["HTTP_X_REQUESTED_WITH"] = "XMLHttpRequest"
     # Reset cached property
-    context.__dict__.pop("headers", None)
+    context.invalidate("headers")
     assert context.is_ajax() is True
 
 
@@ -773,11 +1139,22 @@ def test_accepts_not_supported(context):
 def test_accepts_wildcard(context):
     """Test wildcard acceptance."""
     context.environ["HTTP_ACCEPT"] = "*/*"
-    context.__dict__.pop("accept", None)
+    context.invalidate("accept")
 
     assert context.accepts("application/xml") is True
 
 
+def test_accepts_ignores_parameters_and_partial_matches(context):
+    """Test media types match exactly, ignoring parameters and whitespace."""
+    context.environ["HTTP_ACCEPT"] = "text/html;q=0.9, application/json ; q=1"
+    context.invalidate("accept")
+
+    assert context.accepts("text/html") is True
+    assert context.accepts("application/json") is True
+    assert context.accepts("json") is False
+    assert context.accepts("text/*") is False
+
+
 def test_wants_json_true(context):
     """Test JSON preference detection."""
     assert context.wants_json() is True
@@ -791,7 +1168,7 @@ def test_wants_html_true(context):
 def test_wants_json_false(context):
     """Test JSON preference when not wanted."""
     context.environ["HTTP_ACCEPT"] = "text/plain"
-    context.__dict__.pop("accept", None)
+    context.invalidate("accept")
 
     assert context.wants_json() is False
 
@@ -799,7 +1176,7 @@ def test_wants_json_false(context):
 def test_wants_html_false(context):
     """Test HTML preference when not wanted."""
     context.environ["HTTP_ACCEPT"] = "application/xml"
-    context.__dict__.pop("accept", None)
+    context.invalidate("accept")
 
     assert context.wants_html() is False
 
@@ -824,6 +1201,55 @@ def test_regular_response_wsgi(context):
     assert json.loads(body_data.decode()) == {"message": "hello"}
 
 
+def test_bytes_response_wsgi_passes_body_through(context):
+    """Test a bytes body is emitted as-is in a single-item tuple."""
+    payload = b"already encoded"
+    context.response_body = payload
+
+    status, headers, body = context.as_wsgi()
+
+    assert body == (payload,)
+    assert body[0] is payload
+    assert ("Content-Length", str(len(payload))) in headers
+
+
+def test_response_helpers_encode_body_lazily(context):
+    """Test text/json/html bodies are encoded by as_wsgi, not when set."""
+    context.text("héllo")
+    assert context.response_body == "héllo"
+    assert context.as_wsgi()[2] == ("héllo".encode(),)
+
+    context.html("<p>hi</p>")
+    assert context.as_wsgi()[2] == (b"<p>hi</p>",)
+
+    context.json({"message": "hello"})
+    assert json.loads(context.as_wsgi()[2][0]) == {"message": "hello"}
+
+    context.response_body = "replaced"
+    assert context.as_wsgi()[2] == (b"replaced",)
+
+
+def test_plugin_mutating_json_body_after_view(mock_environ):
+    """Test in-place changes a plugin makes after the view are sent."""
+
+    class StampPlugin(Plugin):
+        def apply(self, handler):
+            def wrapped(ctx):
+                handler(ctx)
+                ctx.response_body["stamped"] = True
+
+            return wrapped
+
+    def view(ctx):
+        ctx.json({"message": "hello"})
+
+    context = Context(mock_environ)
+    StampPlugin().apply(view)(context)
+
+    (body,) = context.as_wsgi()[2]
+    assert json.loads(body) == {"message": "hello", "stamped": True}
+
+
 def test_streaming_response_wsgi(context):
     """Test WSGI conversion for streaming response."""
     test_data = [b"chunk1", b"chunk2", b"chunk3"]
@@ -869,6 +1295,15 @@ def test_wsgi_unknown_status_code(context):
     assert status == "999 Unknown"
 
 
+def test_wsgi_status_lines_cover_http_status(context):
+    """Test every standard status code has a precomputed status line."""
+    for code in HTTPStatus:
+        context.status = code.value
+        status, _, _ = context.as_wsgi()
+        assert status == STATUS_CODE[code.value]
+        assert status.startswith(f"{code.value} ")
+
+
 # ===========================================
 # INTEGRATION AND EDGE CASE TESTS
 # ===========================================
@@ -940,6 +1375,28 @@ def test_context_headers_case_insensitive(context):
     assert context.get_header("X-Custom-Header") == "value1"
 
 
+def test_context_headers_keep_display_case(context):
+    """Test emitted headers keep the casing they were set with."""
+    context.set_header("X-Custom-Header", "value1")
+    context.set_header("x-lower", "value2")
+    context.set_header("X-Deleted", "value3")
+    context.delete_header("x-deleted")
+
+    assert context.response_headers == {
+        "x-custom-header": "value1",
+        "x-lower": "value2",
+    }
+
+    _, headers, _ = context.as_wsgi()
+    assert ("X-Custom-Header", "value1") in headers
+    assert ("x-lower", "value2") in headers
+
+    context.reset_response()
+    context.set_header("x-custom-header", "value1")
+    _, headers, _ = context.as_wsgi()
+    assert ("x-custom-header", "value1") in headers
+
+
 def test_context_body_caching(mock_environ):
     """Test that body parsing is cached."""
     test_data = {"cached": True}
@@ -982,7 +1439,7 @@ def test_context_max_body_size_config(context):
 
     # Test custom config
     context.webspark.config.MAX_BODY_SIZE = 5 * 1024 * 1024
-    context.__dict__.pop("max_body_size", None)  # Reset cached property
+    context.invalidate("max_body_size")  # Reset cached property
     assert context.max_body_size == 5 * 1024 * 1024
 
 
@@ -994,11 +1451,28 @@ def test_context_ip_with_trusted_proxy_list(context):
     context.environ["HTTP_X_FORWARDED_FOR"] = "203.0.113.1, 192.168.1.1"
     context.environ["REMOTE_ADDR"] = "192.168.1.1"
 
-    context.__dict__.pop("ip", None)
+    context.invalidate("ip")
 
     assert context.ip == "203.0.113.1"
 
 
+def test_context_ip_with_trusted_proxy_set(context):
+    """Test IP detection walks back past trusted proxies and empty entries."""
+    context.webspark.config.TRUST_PROXY = True
+    context.webspark.config.TRUSTED_PROXY_LIST = frozenset(("10.0.0.1", "10.0.0.2"))
+
+    context.environ["HTTP_X_FORWARDED_FOR"] = "198.51.100.7, 203.0.113.1,, 10.0.0.2"
+    context.environ["REMOTE_ADDR"] = "10.0.0.1"
+
+    assert context._get_forwarded_ips() == [
+        "198.51.100.7",
+        "203.0.113.1",
+        "10.0.0.2",
+        "10.0.0.1",
+    ]
+    assert context.ip == "203.0.113.1"
+
+
 def test_context_ip_with_proxy_count(context: Context):
     """Test IP detection with trusted proxy count."""
     context.webspark.config.TRUST_PROXY = True
@@ -1007,7 +1481,7 @@ def test_context_ip_with_proxy_count(context: Context):
     context.environ["HTTP_X_FORWARDED_FOR"] = "203.0.113.1, 192.168.1.1"
     context.environ["REMOTE_ADDR"] = "10.0.0.1"
 
-    context.__dict__.pop("ip", None)
+    context.invalidate("ip")
 
     assert context.ip == "192.168.1.1"
 
@@ -1017,7 +1491,7 @@ def test_context_ip_with_x_real_ip(context):
     context.webspark.config.TRUST_PROXY = True
     context.environ["HTTP_X_REAL_IP"] = "203.0.113.1"
 
-    context.__dict__.pop("ip", None)
+    context.invalidate("ip")
 
     assert context.ip == "203.0.113.1"
 
@@ -1027,7 +1501,7 @@ def test_context_scheme_with_forwarded_proto(context):
     context.webspark.config.TRUST_PROXY = True
     context.environ["HTTP_X_FORWARDED_PROTO"] = "http, https"
 
-    context.__dict__.pop("scheme", None)
+    context.invalidate("scheme")
 
     assert context.scheme == "http"  # Takes first value
 
@@ -1037,7 +1511,7 @@ def test_context_host_with_forwarded_host(context):
     context.webspark.config.TRUST_PROXY = True
     context.environ["HTTP_X_FORWARDED_HOST"] = "api.example.com, proxy.example.com"
 
-    context.__dict__.pop("host", None)
+    context.invalidate("host")
 
     assert context.host == "api.example.com"
 
@@ -1074,6 +1548,10 @@ def test_context_body_bytes_conversion(context):
 
     assert context._to_bytes(BytesObject()) == b"custom bytes"
 
+    # Test bytes-like buffers
+    assert context._to_bytes(bytearray(b"buffer")) == b"buffer"
+    assert context._to_bytes(memoryview(b"view")) == b"view"
+
     # Test JSON serialization
     context.set_header("content-type", "application/json")
     result = context._to_bytes({"key": "value"})
@@ -1105,7 +1583,7 @@ def test_context_file_iterator_edge_cases(context):
 
             # Test reading from middle to end
             chunks = list(context._file_iterator(3, 7))
-            assert b"".join(chunks) == b"34567"
+            assert chunks == [b"345", b"67"]
 
             # Test reading beyond file end
             chunks = list(context._file_iterator(5, 20))
@@ -1115,6 +1593,43 @@ def test_context_file_iterator_edge_cases(context):
             os.unlink(tmp.name)
 
 
+def test_context_file_iterator_reads_to_end(context):
+    """Test file iterator on empty files and without an end offset."""
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        pass
+
+    try:
+        context.file_path = tmp.name
+        context.chunk_size = 3
+        assert list(context._file_iterator()) == []
+
+        with open(tmp.name, "wb") as f:
+            f.write(b"0123456789")
+        assert list(context._file_iterator(2)) == [b"234", b"567", b"89"]
+        assert b"".join(context._file_iterator(2, 5)) == b"2345"
+
+    finally:
+        os.unlink(tmp.name)
+
+
+def test_context_file_iterator_truncated_while_streaming(context):
+    """Test file iterator ends early when the file shrinks mid-stream."""
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        tmp.write(b"x" * 65536)
+
+    try:
+        context.file_path = tmp.name
+        context.chunk_size = 16384
+        chunks = context._file_iterator(0, 65535)
+        assert len(next(chunks)) == 16384
+
+        os.truncate(tmp.name, 20000)
+        assert [len(chunk) for chunk in chunks] == [20000 - 16384]
+
+    finally:
+        os.unlink(tmp.name)
+
+
 def test_context_multipart_cleanup():
     """Test multipart parser cleanup."""
     environ = {
@@ -1,15 +1,23 @@
 import base64
+import hashlib
+import hmac
 import json
 from datetime import datetime
-from http.cookies import SimpleCookie
+from http.cookies import CookieError, SimpleCookie
+from unittest.mock import patch
 
 import pytest
 
 from webspark.http.cookie import (
+    _cookie_attributes,
+    _format_gmt,
+    _hmac_prototype,
     _make_expires,
     _sign,
     _verify,
     parse_cookie,
+    parse_cookie_single,
+    parse_cookie_value,
     serialize_cookie,
 )
 
@@ -20,12 +28,33 @@ def test_make_expires_with_datetime():
     assert result == "Mon, 25-Dec-2023 10:30:45 GMT"
 
 
+def test_make_expires_pads_fields():
+    dt = datetime(2024, 3, 3, 4, 5, 6)
+    assert _make_expires(dt) == "Sun, 03-Mar-2024 04:05:06 GMT"
+
+
 def test_make_expires_with_int():
     result = _make_expires(3600)
     assert isinstance(result, str)
     assert "GMT" in result
 
 
+def test_make_expires_with_int_is_utc():
+    with patch("time.time", return_value=1703500245.9):
+        assert _make_expires(3600) == "Mon, 25-Dec-2023 11:30:45 GMT"
+
+
+def test_make_expires_with_int_cached_within_second():
+    _format_gmt.cache_clear()
+    with patch("time.time", return_value=1703500245.1):
+        first = _make_expires(3600)
+    with patch("time.time", return_value=1703500245.8):
+        assert _make_expires(3600) is first
+    with patch("time.time", return_value=1703500246.0):
+        assert _make_expires(3600) == "Mon, 25-Dec-2023 11:30:46 GMT"
+    assert _format_gmt.cache_info().hits == 1
+
+
 def test_make_expires_with_invalid_type():
     with pytest.raises(ValueError, match="Date must be datetime or int"):
         _make_expires("invalid")
@@ -39,10 +68,43 @@ def test_sign_and_verify():
     assert _verify(data, signature, "secret1") is True
 
 
+def test_sign_reuses_keyed_hmac_state():
+    _hmac_prototype.cache_clear()
+    first = _sign("data", "secret1")
+    second = _sign("data", "secret1")
+
+    assert first == second
+    assert (
+        first
+        == base64.urlsafe_b64encode(
+            hmac.new(b"secret1", b"data", hashlib.sha256).digest()
+        )
+        .rstrip(b"=")
+        .decode()
+    )
+    assert _sign("other", "secret1") != first
+    assert _hmac_prototype.cache_info().misses == 1
+
+
 def test_verify_with_invalid_signature():
     assert _verify("test_data", "invalid_signature", "secret1") is False
 
 
+def test_verify_compares_raw_digests():
+    signature = _sign("data", "secret1")
+
+    assert _verify("data", signature + "=", "secret1") is True
+    assert _verify("data", signature[:-1], "secret1") is False
+    assert _verify("data", "sïgnature", "secret1") is False
+
+
+def test_verify_skips_hmac_on_length_mismatch():
+    with patch("webspark.http.cookie._digest") as digest:
+        assert _verify("data", "invalid_signature", "secret1") is False
+        assert _verify("data", "", "secret1") is False
+    digest.assert_not_called()
+
+
 def test_serialize_without_secrets():
     data = {"key": "value", "number": 42}
     serialized = serialize_cookie("test_cookie", data)
@@ -68,6 +130,45 @@ def test_serialize_with_custom_options():
     assert "HttpOnly" not in serialized
 
 
+def test_serialize_matches_simple_cookie_output():
+    dt = datetime(2023, 12, 25, 10, 30, 45)
+    for data, secret in (("ab", None), ("abc", None), ({"key": "value"}, "secret1")):
+        serialized = serialize_cookie(
+            "test_cookie", data, secret=secret, expires=dt, secure=True
+        )
+
+        value = serialized.split(";", 1)[0].split("=", 1)[1].strip('"')
+        cookie = SimpleCookie()
+        cookie["test_cookie"] = value
+        cookie["test_cookie"]["Expires"] = "Mon, 25-Dec-2023 10:30:45 GMT"
+        cookie["test_cookie"]["Max-Age"] = 3600
+        cookie["test_cookie"]["Path"] = "/"
+        cookie["test_cookie"]["HttpOnly"] = True
+        cookie["test_cookie"]["Secure"] = True
+        cookie["test_cookie"]["SameSite"] = "Lax"
+        assert serialized == cookie.output(header="", sep="").strip()
+
+
+def test_serialize_caches_attributes_per_options():
+    _cookie_attributes.cache_clear()
+    first = serialize_cookie("a", 1)
+    second = serialize_cookie("b", 2, expires=60)
+
+    assert first.endswith("; HttpOnly; Max-Age=3600; Path=/; SameSite=Lax")
+    assert "; expires=" in second
+    assert second.endswith("; HttpOnly; Max-Age=3600; Path=/; SameSite=Lax")
+    assert serialize_cookie("c", 3, secure=True, http_only=False).endswith(
+        "; Max-Age=3600; Path=/; SameSite=Lax; Secure"
+    )
+    assert _cookie_attributes.cache_info().misses == 2
+
+
+@pytest.mark.parametrize("name", ["", "path", "Max-Age", "a b", "a;b"])
+def test_serialize_rejects_illegal_names(name):
+    with pytest.raises(CookieError):
+        serialize_cookie(name, "value")
+
+
 def test_serialize_with_expires_datetime():
     dt = datetime(2023, 12, 25, 10, 30, 45)
     serialized = serialize_cookie("test_cookie", {"key": "value"}, expires=dt)
@@ -89,7 +190,9 @@ def test_serialize_with_secrets():
 def test_parse_without_secrets():
     data = {"key": "value", "number": 42}
     cookie_obj = SimpleCookie()
-    cookie_obj["test_cookie"] = base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+    cookie_obj["test_cookie"] = base64.urlsafe_b64encode(
+        json.dumps(data).encode()
+    ).decode()
     cookie_header = cookie_obj.output(header="", sep="").strip()
 
     parsed = parse_cookie(cookie_header)
@@ -138,6 +241,79 @@ def test_parse_with_malformed_signed_cookie():
     assert parsed["test_cookie"] is None
 
 
+def test_parse_multiple_cookies_header():
+    first = serialize_cookie("first", {"a": 1}).split(";")[0]
+    second = serialize_cookie("second", [1, 2]).split(";")[0]
+
+    assert parse_cookie(f"{first}; {second}") == {"first": {"a": 1}, "second": [1, 2]}
+    assert parse_cookie(f"{first};{second}") == {"first": {"a": 1}, "second": [1, 2]}
+
+
+def test_parse_quoted_cookie_value():
+    value = base64.urlsafe_b64encode(json.dumps("hi").encode()).decode()
+    parsed = parse_cookie(f'test_cookie="{value}"; Path=/')
+    assert parsed == {"test_cookie": "hi"}
+
+
+def test_parse_mixed_quoted_and_signed_cookies():
+    signed = serialize_cookie("signed", {"id": 7}, secret="secret1").split(";")[0]
+    plain = serialize_cookie("plain", "abc").split(";")[0]
+    header = f'{signed}; plain={plain.split("=", 1)[1]}; empty=""; broken="x'
+
+    assert parse_cookie(header, "secret1") == {
+        "signed": {"id": 7},
+        "plain": "abc",
+        "empty": None,
+        "broken": None,
+    }
+
+
+def test_serialize_drops_base64_padding():
+    signed = serialize_cookie("signed", {"id": 7}, secret="secret1").split(";")[0]
+    plain = serialize_cookie("plain", "abc").split(";")[0]
+
+    value, signature = signed.split("=", 1)[1].split(".")
+    assert "=" not in value + signature
+    assert '"' not in signed
+    assert len(signature) == 43
+    assert plain == "plain=ImFiYyI"  # base64 of '"abc"' is 'ImFiYyI='
+
+
+def test_parse_padded_cookies():
+    data = base64.urlsafe_b64encode(b'{"id":7}').decode()
+    signature = base64.urlsafe_b64encode(
+        hmac.new(b"secret1", b'{"id":7}', hashlib.sha256).digest()
+    ).decode()
+    header = f'signed="{data}.{signature}"; plain="{data}"'
+
+    assert parse_cookie(header, "secret1") == {"signed": {"id": 7}, "plain": {"id": 7}}
+
+
+def test_parse_single_cookie():
+    signed = serialize_cookie("signed", {"id": 7}, secret="secret1").split(";")[0]
+    header = f'{signed}; plain="ImFiYyI="; broken=x; plain=ImRlZiI'
+
+    assert parse_cookie_single(header, "signed", "secret1") == {"id": 7}
+    assert parse_cookie_single(header, "signed", "secret2") is None
+    assert parse_cookie_single(header, "plain") == "def"
+    assert parse_cookie_single(header, "broken") is None
+    assert parse_cookie_single(header, "lain") is None
+    assert parse_cookie_single("path=Ijsi", "path") is None
+    assert parse_cookie_single(None, "plain") is None
+    assert parse_cookie_single(header, "plain") == parse_cookie(header)["plain"]
+
+
+def test_parse_cookie_value():
+    signed = serialize_cookie("signed", {"id": 7}, secret="secret1")
+    value = signed.split(";")[0].split("=", 1)[1]
+
+    assert parse_cookie_value(value, "secret1") == {"id": 7}
+    assert parse_cookie_value(f'"{value}"', "secret1") == {"id": 7}
+    assert parse_cookie_value(value, "secret2") is None
+    assert parse_cookie_value("ImFiYyI") == "abc"
+    assert parse_cookie_value("not json") is None
+
+
 def test_parse_none_header():
     parsed = parse_cookie(None)
     assert parsed == {}
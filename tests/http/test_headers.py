@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from webspark.http.headers import HeadersView
+
+
+def test_from_environ():
+    headers = HeadersView.from_environ(
+        {
+            "HTTP_HOST": "example.com",
+            "HTTP_X_REQUESTED_WITH": "XMLHttpRequest",
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": "10",
+            "REQUEST_METHOD": "GET",
+        }
+    )
+
+    assert dict(headers) == {
+        "host": "example.com",
+        "x-requested-with": "XMLHttpRequest",
+        "content-type": "application/json",
+        "content-length": "10",
+    }
+
+
+def test_from_environ_cgi_variables_take_precedence():
+    headers = HeadersView.from_environ(
+        {"HTTP_CONTENT_TYPE": "text/plain", "CONTENT_TYPE": "application/json"}
+    )
+    assert list(headers.items()) == [("content-type", "application/json")]
+
+    headers = HeadersView.from_environ({"HTTP_CONTENT_LENGTH": "5"})
+    assert headers["content-length"] == "5"
+
+
+def test_lookup():
+    headers = HeadersView((("host", "example.com"), ("accept", "*/*")))
+
+    assert headers["accept"] == "*/*"
+    assert headers.get("cookie") is None
+    assert headers.get("cookie", "") == ""
+    assert "host" in headers
+    assert "cookie" not in headers
+    assert len(headers) == 2
+    assert headers == {"host": "example.com", "accept": "*/*"}
+
+    with pytest.raises(KeyError):
+        headers["cookie"]
+
+
+def test_assignment():
+    headers = HeadersView((("host", "example.com"), ("accept", "*/*")))
+
+    headers["host"] = "other.com"
+    headers["range"] = "bytes=0-4"
+    del headers["accept"]
+
+    assert list(headers.items()) == [("host", "other.com"), ("range", "bytes=0-4")]
+
+    with pytest.raises(KeyError):
+        del headers["accept"]
+
+
+def test_dict_compatibility():
+    headers = HeadersView((("host", "example.com"), ("accept", "*/*")))
+
+    copied = headers.copy()
+    copied["host"] = "other.com"
+    assert copied == {"host": "other.com", "accept": "*/*"}
+    assert headers["host"] == "example.com"
+
+    assert headers | {"accept": "text/html"} == {
+        "host": "example.com",
+        "accept": "text/html",
+    }
+    assert {"host": "other.com", "cookie": "a=1"} | headers == {
+        "host": "example.com",
+        "cookie": "a=1",
+        "accept": "*/*",
+    }
+    assert json.loads(json.dumps(dict(headers))) == dict(headers)
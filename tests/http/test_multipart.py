@@ -3,7 +3,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from webspark.http.multipart import MultipartParser
+from webspark.http.multipart import DelimiterEnum, MultipartParser
 from webspark.utils.exceptions import HTTPException
 
 
@@ -18,7 +18,7 @@ def test_multipart_parser_initialization():
     assert parser._content_type == content_type
     assert parser._content_length == content_length
     assert parser._max_body_size == 2 * 1024 * 1024
-    assert parser._chunk_size == 4096
+    assert parser._chunk_size == 64 * 1024
     assert parser._encoding == "utf-8"
     assert parser._encoding_errors == "strict"
     assert parser.forms == {}
@@ -81,6 +81,27 @@ def test_boundary_property_missing():
     assert "Missing boundary in Content-Type header" in str(exc_info.value)
 
 
+def test_boundary_property_is_cached():
+    content_type = "multipart/form-data; boundary=boundary"
+    parser = MultipartParser(io.BytesIO(b""), content_type, 0)
+
+    assert parser.boundary is parser.boundary
+
+
+def test_boundary_property_too_long():
+    content_type = f"multipart/form-data; boundary={'b' * 257}"
+    parser = MultipartParser(io.BytesIO(b""), content_type, 0)
+
+    with pytest.raises(HTTPException) as exc_info:
+        _ = parser.boundary
+
+    assert exc_info.value.status_code == 400
+    assert "Boundary in Content-Type header is too long" in str(exc_info.value)
+
+    content_type = f"multipart/form-data; boundary={'b' * 256}"
+    assert MultipartParser(io.BytesIO(b""), content_type, 0).boundary == "b" * 256
+
+
 def test_content_length_property():
     stream = io.BytesIO(b"")
     content_type = "multipart/form-data; boundary=boundary"
@@ -220,6 +241,71 @@ def test_process_headers():
     assert parser._cfield["content_type"] == "text/plain"
 
 
+def test_process_headers_quoted_params():
+    parser = MultipartParser(io.BytesIO(b""), "", 0)
+    parser._delimiter = DelimiterEnum.CRLF
+
+    parser._process_headers(
+        b"content-type: Image/PNG; charset=binary\r\n"
+        b'Content-Disposition: form-data; NAME="a\\"b"; filename="x;y.png"\r\n'
+        b"Content-Type: text/plain"
+    )
+
+    assert parser._cfield == {
+        "name": 'a"b',
+        "filename": "x;y.png",
+        "content_type": "image/png",
+    }
+
+
+def test_process_headers_extended_filename():
+    parser = MultipartParser(io.BytesIO(b""), "", 0)
+    parser._delimiter = DelimiterEnum.CRLF
+
+    parser._process_headers(
+        b'Content-Disposition: form-data; name="file"; '
+        b"filename*=UTF-8''%E2%82%AC%20rates.txt; filename=\"rates.txt\""
+    )
+
+    assert parser._cfield["filename"] == "\u20ac rates.txt"
+
+
+def test_process_headers_invalid_extended_filename():
+    parser = MultipartParser(io.BytesIO(b""), "", 0)
+    parser._delimiter = DelimiterEnum.CRLF
+
+    parser._process_headers(
+        b'Content-Disposition: form-data; name="file"; filename="rates.txt"; '
+        b"filename*=UTF-8''%FF"
+    )
+
+    assert parser._cfield["filename"] == "rates.txt"
+
+
+def test_process_headers_escaped_backslash_before_quote():
+    parser = MultipartParser(io.BytesIO(b""), "", 0)
+    parser._delimiter = DelimiterEnum.CRLF
+
+    parser._process_headers(
+        b'Content-Disposition: form-data; filename="a\\\\"; name="field"'
+    )
+
+    assert parser._cfield == {
+        "name": "field",
+        "filename": "a\\",
+        "content_type": "text/plain",
+    }
+
+
+def test_process_headers_missing_content_type():
+    parser = MultipartParser(io.BytesIO(b""), "", 0)
+    parser._delimiter = DelimiterEnum.CRLF
+
+    parser._process_headers(b"Content-Disposition: form-data; name=field")
+
+    assert parser._cfield == {"name": "field", "content_type": "text/plain"}
+
+
 def test_parse_simple_form_data():
     boundary = "----WebKitFormBoundary7MA4YWxkTrZu0gW"
     form_data = (
@@ -241,6 +327,92 @@ def test_parse_simple_form_data():
     assert files == {}
 
 
+def test_parse_form_field_spanning_many_chunks():
+    boundary = "boundary"
+    value = "0123456789" * 1000
+    form_data = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="field1"\r\n\r\n'
+        f"{value}\r\n"
+        f"--{boundary}--\r\n"
+    ).encode()
+
+    stream = io.BytesIO(form_data)
+    content_type = f"multipart/form-data; boundary={boundary}"
+
+    parser = MultipartParser(stream, content_type, len(form_data), chunk_size=64)
+    forms, files = parser.parse()
+
+    assert forms == {"field1": value}
+    assert files == {}
+
+
+@pytest.mark.parametrize("chunk_size", [64, 64 * 1024])
+def test_parse_many_parts(chunk_size):
+    form_data = "".join(
+        f'--b\r\nContent-Disposition: form-data; name="f{i}"\r\n\r\nv{i}\r\n'
+        for i in range(200)
+    )
+    form_data = (form_data + "--b--\r\n").encode()
+
+    stream = io.BytesIO(form_data)
+    content_type = "multipart/form-data; boundary=b"
+
+    parser = MultipartParser(
+        stream, content_type, len(form_data), chunk_size=chunk_size
+    )
+    forms, files = parser.parse()
+
+    assert forms == {f"f{i}": f"v{i}" for i in range(200)}
+    assert files == {}
+
+
+def test_parse_file_spanning_many_chunks():
+    boundary = "boundary"
+    content = bytes(range(256)) * 64
+    form_data = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="blob.bin"\r\n'
+        "Content-Type: application/octet-stream\r\n\r\n"
+    ).encode()
+    form_data += content + f"\r\n--{boundary}--\r\n".encode()
+
+    stream = io.BytesIO(form_data)
+    content_type = f"multipart/form-data; boundary={boundary}"
+
+    with MultipartParser(
+        stream, content_type, len(form_data), chunk_size=100
+    ) as parser:
+        forms, files = parser.parse()
+
+        assert forms == {}
+        assert files["file"]["file"].read() == content
+
+
+@pytest.mark.parametrize("chunk_size", [5, 6, 7, 8, 13])
+def test_parse_delimiters_straddling_chunks(chunk_size):
+    form_data = (
+        b"--b\r\n"
+        b'Content-Disposition: form-data; name="first"\r\n\r\n'
+        b"one\r\n"
+        b"--b\r\n"
+        b'Content-Disposition: form-data; name="second"\r\n\r\n'
+        b"two\r\n"
+        b"--b--\r\n"
+    )
+
+    stream = io.BytesIO(form_data)
+    content_type = "multipart/form-data; boundary=b"
+
+    parser = MultipartParser(
+        stream, content_type, len(form_data), chunk_size=chunk_size
+    )
+    forms, files = parser.parse()
+
+    assert forms == {"first": "one", "second": "two"}
+    assert files == {}
+
+
 def test_parse_file_upload():
     boundary = "----WebKitFormBoundary7MA4YWxkTrZu0gW"
     form_data = (
@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
@@ -112,6 +113,30 @@ def test_schema_meta():
     assert isinstance(TestSchema._declared_fields["field2"], IntegerField)
 
 
+def test_schema_declared_fields_shared_and_read_only():
+    class TestSchema(Schema):
+        field1 = StringField()
+
+    schema1 = TestSchema(data={})
+    schema2 = TestSchema(data={})
+
+    assert schema1.fields is TestSchema._declared_fields
+    assert schema2.fields is TestSchema._declared_fields
+    with pytest.raises(TypeError):
+        TestSchema._declared_fields["field2"] = IntegerField()
+
+
+def test_schema_field_plan():
+    class TestSchema(Schema):
+        field1 = StringField()
+        field2 = IntegerField(source_name="other")
+
+    assert TestSchema._field_plan == (
+        ("field1", "field1", TestSchema._declared_fields["field1"]),
+        ("field2", "other", TestSchema._declared_fields["field2"]),
+    )
+
+
 def test_schema_inheritance():
     class BaseSchema(Schema):
         base_field = StringField()
@@ -123,13 +148,24 @@ def test_schema_inheritance():
     assert "child_field" in ChildSchema._declared_fields
 
 
+def test_schema_inheritance_override():
+    class BaseSchema(Schema):
+        name = StringField()
+        age = StringField()
+
+    class ChildSchema(BaseSchema):
+        age = IntegerField()
+
+    assert list(ChildSchema._declared_fields) == ["name", "age"]
+    assert isinstance(ChildSchema._declared_fields["age"], IntegerField)
+    assert ChildSchema._declared_fields["age"].name == "age"
+
+
 def test_schema_initialization():
     class TestSchema(Schema):
         pass
 
-    schema = TestSchema(
-        data={"key": "value"}, context={"ctx": "test"}
-    )
+    schema = TestSchema(data={"key": "value"}, context={"ctx": "test"})
 
     assert schema.initial_data == {"key": "value"}
     assert schema.context == {"ctx": "test"}
@@ -261,6 +297,21 @@ def test_integer_field_validate_min_value():
     assert "Value must be at least 18." in exc_info.value.details["age"][0]
 
 
+def test_field_error_message_factory():
+    factory = Mock(side_effect=lambda min_value: f"Too small, min is {min_value}.")
+    field = IntegerField(min_value=18, error_messages={"min_value": factory})
+    field.name = "age"
+
+    assert field.validate(25) == 25
+    factory.assert_not_called()
+
+    with pytest.raises(HTTPException) as exc_info:
+        field.validate(10)
+
+    factory.assert_called_once_with(min_value=18)
+    assert exc_info.value.details["age"] == ["Too small, min is 18."]
+
+
 def test_integer_field_validate_max_value():
     field = IntegerField(max_value=100)
     field.name = "age"
@@ -475,10 +526,28 @@ def test_list_field_validate_with_child_field_errors():
     field.name = "numbers"
 
     with pytest.raises(HTTPException) as exc_info:
-        field.validate(["1", "invalid", "3"])
+        field.validate(["1", "invalid", "3", "bad"])
 
     assert exc_info.value.status_code == 400
-    assert "numbers" in exc_info.value.details
+    errors = exc_info.value.details["numbers"]
+    assert [next(iter(error)) for error in errors] == [1, 3]
+
+
+def test_list_field_validates_each_item_once():
+    calls = []
+
+    def record(value, field):
+        calls.append(value)
+        return value
+
+    field = ListField(child=IntegerField(validators=[record]))
+    field.name = "numbers"
+
+    with pytest.raises(HTTPException) as exc_info:
+        field.validate(["1", "invalid", "3"])
+
+    assert calls == [1, 3]
+    assert [next(iter(error)) for error in exc_info.value.details["numbers"]] == [1]
 
 
 def test_list_field_to_representation():
@@ -535,6 +604,17 @@ def test_datetime_field_validate_invalid():
     )
 
 
+def test_datetime_field_validate_non_string():
+    field = DateTimeField()
+    field.name = "created_at"
+
+    with pytest.raises(HTTPException) as exc_info:
+        field.validate(1672574400)
+
+    assert exc_info.value.status_code == 400
+    assert "created_at" in exc_info.value.details
+
+
 def test_datetime_field_auto_now():
     field = DateTimeField(auto_now=True)
     result = field.validate("2023-01-01T12:00:00")
@@ -551,6 +631,30 @@ def test_uuid_field_validate():
     assert str(result) == uuid_str
 
 
+def test_uuid_field_validate_other_forms():
+    field = UUIDField()
+    field.name = "id"
+
+    value = uuid.UUID("550e8400-e29b-41d4-a716-446655440000")
+    assert field.validate(value) is value
+    assert field.validate("550e8400e29b41d4a716446655440000") == value
+    assert field.validate("{550e8400-e29b-41d4-a716-446655440000}") == value
+    assert field.validate("550E8400-E29B-41D4-A716-446655440000") == value
+
+    with pytest.raises(HTTPException):
+        field.validate("550e8400-e29b-41d4-a716-44665544zzzz")
+
+
+def test_uuid_field_validate_extra_hyphen():
+    field = UUIDField()
+    field.name = "id"
+
+    with pytest.raises(HTTPException) as exc_info:
+        field.validate("12345678-1234-1234-1234-1234567890-1")
+
+    assert exc_info.value.status_code == 400
+
+
 def test_uuid_field_validate_invalid():
     field = UUIDField()
     field.name = "id"
@@ -602,6 +706,10 @@ def test_url_field_validate_invalid():
     assert "website" in exc_info.value.details
     assert "Value must be a valid URL" in exc_info.value.details["website"][0]
 
+    for value in ("http:///path", "http://[::1", "://example.com"):
+        with pytest.raises(HTTPException):
+            field.validate(value)
+
 
 def test_url_field_validate_with_schemes():
     field = URLField(schemes=["https"])
@@ -640,6 +748,21 @@ def test_enum_field_validate_with_list():
     assert result == "red"
 
 
+def test_enum_field_validate_unhashable():
+    field = EnumField(["red", "green"])
+    field.name = "color"
+
+    with pytest.raises(HTTPException):
+        field.validate(["red"])
+
+    field = EnumField([["red"], ["green"]])
+    field.name = "color"
+
+    assert field.validate(["red"]) == ["red"]
+    with pytest.raises(HTTPException):
+        field.validate(["blue"])
+
+
 def test_enum_field_validate_invalid():
     field = EnumField(["red", "green", "blue"])
     field.name = "color"
@@ -660,6 +783,11 @@ def test_decimal_field_validate():
     assert isinstance(result, Decimal)
     assert result == Decimal("10.50")
 
+    value = Decimal("3.14")
+    assert field.validate(value) is value
+    assert field.validate(42) == Decimal(42)
+    assert field.validate(0.1) == Decimal("0.1")
+
 
 def test_decimal_field_validate_invalid():
     field = DecimalField()
@@ -808,6 +936,21 @@ def test_serializer_field_validate_many_invalid():
     assert "nested" in exc_info.value.details
 
 
+def test_schema_validate_many():
+    class NestedSchema(Schema):
+        name = StringField(required=True)
+
+    validated, errors = NestedSchema.validate_many(
+        [{"name": "John"}, {}, {"name": "Jane"}, {"name": 1}]
+    )
+
+    assert validated == [{"name": "John"}, {"name": "Jane"}]
+    assert errors == {
+        "1": {"name": ["This field is required."]},
+        "3": {"name": ["Value must be a string."]},
+    }
+
+
 def test_serializer_field_validate_many_not_list():
     class NestedSchema(Schema):
         name = StringField()
@@ -881,6 +1024,69 @@ def test_serializer_field_to_representation_none():
     assert result is None
 
 
+def test_schema_serialize():
+    class TagSchema(Schema):
+        label = StringField()
+
+    class UserSchema(Schema):
+        name = StringField()
+        user_age = IntegerField(source_name="age")
+        tags = SerializerField(TagSchema, many=True)
+        greeting = MethodField("get_greeting")
+
+        def get_greeting(self, obj):
+            if isinstance(obj, dict):
+                return f"Hello, {obj['name']}!"
+            return f"Hello, {obj.name}!"
+
+    class Tag:
+        label = "admin"
+
+    class User:
+        name = "John"
+        age = 30
+        tags = [Tag()]
+
+    expected = {
+        "name": "John",
+        "user_age": 30,
+        "tags": [{"label": "admin"}],
+        "greeting": "Hello, John!",
+    }
+
+    assert UserSchema.serialize(User()) == expected
+    assert UserSchema.serialize([User()], many=True) == [expected]
+    data = {"name": "John", "age": 30, "tags": [{"label": "admin"}]}
+    assert UserSchema.serialize(data) == expected
+
+
+def test_schema_serialize_keyword_source_names():
+    class RouteSchema(Schema):
+        origin = StringField(source_name="from")
+        kind = StringField(source_name="class")
+
+    class Route:
+        pass
+
+    route = Route()
+    setattr(route, "from", "home")
+    setattr(route, "class", "direct")
+
+    assert RouteSchema.serialize(route) == {"origin": "home", "kind": "direct"}
+
+
+def test_schema_serialize_missing_attribute():
+    class UserSchema(Schema):
+        name = StringField()
+        created = DateTimeField()
+
+    assert UserSchema.serialize({"name": "x"}) == {"name": "x", "created": None}
+    assert UserSchema.serialize(SimpleNamespace(name="x")) == {
+        "name": "x",
+        "created": None,
+    }
+
+
 def test_schema_full_integration():
     class UserSchema(Schema):
         name = StringField(max_length=50)
@@ -913,6 +1119,23 @@ def test_schema_full_integration():
     assert schema.validated_data["tags"] == ["developer", "python"]
 
 
+def test_schema_success_path_does_not_build_errors(monkeypatch):
+    from webspark.validation import fields
+
+    exception = Mock(side_effect=HTTPException)
+    monkeypatch.setattr(fields, "HTTPException", exception)
+
+    class UserSchema(Schema):
+        name = StringField(max_length=50)
+        age = IntegerField(min_value=0)
+        tags = ListField(child=StringField())
+
+    schema = UserSchema(data={"name": "John", "age": 25, "tags": ["a", "b"]})
+
+    assert schema.is_valid() is True
+    exception.assert_not_called()
+
+
 def test_schema_custom_validation_error():
     class UserSchema(Schema):
         age = IntegerField()
@@ -1,4 +1,9 @@
-from webspark.utils.exceptions import HTTPException
+from webspark.utils.exceptions import (
+    HOST_NOT_ALLOWED,
+    METHOD_NOT_ALLOWED,
+    ROUTE_NOT_FOUND,
+    HTTPException,
+)
 
 
 def test_http_exception_default_status_code():
@@ -18,3 +23,20 @@ def test_http_exception_with_dict_details():
     exc = HTTPException(details, status_code=400)
     assert exc.details == details
     assert exc.status_code == 400
+
+
+def test_shared_messages_raise_fresh_exceptions():
+    assert ROUTE_NOT_FOUND == "Route not found."
+    assert METHOD_NOT_ALLOWED == "Method not allowed."
+    assert HOST_NOT_ALLOWED == "Host not allowed."
+
+    raised = []
+    for _ in range(2):
+        try:
+            raise HTTPException(ROUTE_NOT_FOUND, status_code=404)
+        except HTTPException as exc:
+            raised.append(exc)
+
+    assert raised[0] is not raised[1]
+    assert raised[0].details == ROUTE_NOT_FOUND
+    assert raised[0].status_code == 404
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -9,6 +10,7 @@ if TYPE_CHECKING:
 
 from ...core.plugin import Plugin
 from ...utils import HTTPException
+from ...utils.exceptions import HOST_NOT_ALLOWED
 
 
 class AllowedHostsPlugin(Plugin):
@@ -17,6 +19,20 @@ class AllowedHostsPlugin(Plugin):
     def __init__(self, allowed_hosts: list[str]):
         self.allowed_hosts = allowed_hosts
 
+        self._allow_all = "*" in allowed_hosts
+        self._exact_hosts = frozenset(
+            pattern[1:] if pattern.startswith(".") else pattern
+            for pattern in allowed_hosts
+        )
+        suffixes = [pattern for pattern in allowed_hosts if pattern.startswith(".")]
+        self._suffix_re = (
+            re.compile(
+                r"\A.*(?:" + "|".join(map(re.escape, suffixes)) + r")\Z", re.DOTALL
+            )
+            if suffixes
+            else None
+        )
+
     def apply(self, handler: Callable) -> Callable:
         """Apply the plugin to a view handler.
 
@@ -46,24 +62,27 @@ class AllowedHostsPlugin(Plugin):
             HTTPException: If the host header is missing, invalid, or not
                           in the allowed hosts list (status code 400).
         """
-        allowed_hosts = self.allowed_hosts
-
-        if not allowed_hosts:
-            raise HTTPException("Host not allowed.", status_code=400)
-
-        host = ctx.host.split(":")[0] if ctx.host else ""
+        if not self.allowed_hosts:
+            raise HTTPException(HOST_NOT_ALLOWED, status_code=400)
+
+        host = ctx.host or ""
+        if host.startswith("["):
+            # IPv6 literal, e.g. "[::1]:8000": keep the bracketed address.
+            end = host.find("]")
+            if end != -1:
+                host = host[: end + 1]
+        else:
+            colon = host.rfind(":")
+            if colon != -1:
+                host = host[:colon]
 
         if not host:
             raise HTTPException("Invalid or missing host header.", status_code=400)
 
-        if "*" in allowed_hosts:
+        if self._allow_all or host in self._exact_hosts:
             return
 
-        for pattern in allowed_hosts:
-            if pattern.startswith("."):
-                if host.endswith(pattern) or host == pattern[1:]:
-                    return
-            elif host == pattern:
-                return
+        if self._suffix_re is not None and self._suffix_re.match(host):
+            return
 
-        raise HTTPException("Host not allowed.", status_code=400)
+        raise HTTPException(HOST_NOT_ALLOWED, status_code=400)
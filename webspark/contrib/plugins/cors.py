@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 
 from ...core.plugin import Plugin
 from ...utils import HTTPException
+from ...utils.exceptions import METHOD_NOT_ALLOWED
 
 
 class CORSPlugin(Plugin):
@@ -163,7 +164,7 @@ class CORSPlugin(Plugin):
         """
         requested_method = ctx.headers.get("access-control-request-method")
         if requested_method and requested_method not in self.allow_methods:
-            raise HTTPException("Method not allowed.", status_code=405)
+            raise HTTPException(METHOD_NOT_ALLOWED, status_code=405)
 
         requested_headers = ctx.headers.get("access-control-request-headers")
         if requested_headers:
@@ -34,11 +34,21 @@ class _TrieNode:
 
 
 class TrieRouter:
-    """A trie-backed router supporting static segments, ':param' segments, and '*wildcard'."""
+    """A trie-backed router supporting static segments, ':param' segments, and '*wildcard'.
+
+    Attributes:
+        root: The root _TrieNode.
+        routes: Registered paths in insertion order, kept for introspection only.
+        static_routes: Routes without ':param' or '*wildcard' segments, keyed by
+            their canonical request paths ('/a/b' and '/a/b/') for a single dict
+            lookup before walking the trie.
+    """
 
     def __init__(self):
         """Initialize the router with an empty root node."""
         self.root = _TrieNode()
+        self.routes: list[path] = []
+        self.static_routes: dict[str, path] = {}
 
     def add_route(self, path_: path):
         """Register a handler for the given route pattern.
@@ -77,6 +87,7 @@ class TrieRouter:
                             f"{node.wildcard_child.wildcard_name} vs {wc_name}."
                         )
                 node.wildcard_child.path = path_
+                self.routes.append(path_)
                 return
 
             if segment.startswith(":"):
@@ -105,6 +116,13 @@ class TrieRouter:
             node = node.children[segment]
 
         node.path = path_
+        self.routes.append(path_)
+
+        if not seen_params:
+            static_path = "/" + "/".join(segments)
+            self.static_routes[static_path] = path_
+            if segments:
+                self.static_routes[static_path + "/"] = path_
 
     def search(self, path_: str) -> tuple[None | path, dict[str, str]]:
         """Find a handler for a concrete request path.
@@ -117,6 +135,10 @@ class TrieRouter:
             or None if no match exists, and params is a dict of extracted
             parameters for ':param' and '*wildcard' segments.
         """
+        static = self.static_routes.get(path_)
+        if static is not None:
+            return static, {}
+
         node = self.root
         segments = self._split_path(path_)
         params = {}
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from functools import update_wrapper
+from inspect import isfunction
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -9,10 +10,35 @@ if TYPE_CHECKING:
 
 from ..constants import HTTP_METHODS
 from ..utils import HTTPException
+from ..utils.exceptions import METHOD_NOT_ALLOWED
 
 DEFAULT_ACTIONS = {http_method: f"handle_{http_method}" for http_method in HTTP_METHODS}
 
 
+def _resolve_handlers(cls: type, actions: dict[str, str]) -> dict[str, Callable]:
+    """Map HTTP methods to the plain functions implementing their actions.
+
+    Actions that do not resolve to a plain function on the class (missing names,
+    static or class methods, ...) are left out and looked up per request instead.
+
+    Args:
+        cls: The View class.
+        actions: Mapping of HTTP methods to handler method names.
+
+    Returns:
+        dict: Mapping of HTTP methods to unbound handler functions.
+    """
+    handlers = {}
+    for http_method, handler_name in actions.items():
+        for klass in cls.__mro__:
+            if handler_name in klass.__dict__:
+                handler = klass.__dict__[handler_name]
+                if isfunction(handler):
+                    handlers[http_method] = handler
+                break
+    return handlers
+
+
 class View:
     """Base view class for WebSpark applications.
 
@@ -48,6 +74,20 @@ class View:
         action_map (dict): Mapping of HTTP methods to handler methods.
     """
 
+    _default_actions: dict[str, str] = {}
+    _handlers: dict[str, Callable] = {}
+    _as_view_cache: Callable[[Context], None] | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompute the default action map of each View subclass."""
+        super().__init_subclass__(**kwargs)
+        cls._default_actions = {
+            http_method: handler_name
+            for http_method, handler_name in DEFAULT_ACTIONS.items()
+            if hasattr(cls, handler_name)
+        }
+        cls._as_view_cache = None
+
     @property
     def ctx(self):
         """Get the current context object.
@@ -76,7 +116,8 @@ class View:
 
         This method converts a View class into a callable function that can be
         used as a WSGI application. It handles HTTP method dispatching and
-        view instantiation.
+        view instantiation. Calls without actions or initkwargs return the same
+        function, cached on the class.
 
         Args:
             actions: Mapping of HTTP methods to handler method names.
@@ -99,21 +140,23 @@ class View:
             # Pass initialization arguments
             view_func = MyView.as_view(custom_param="value")
         """
+        cacheable = not actions and not initkwargs
+        if cacheable and cls._as_view_cache is not None:
+            return cls._as_view_cache
+
         if not actions:
-            actions = {
-                http_method: handler_name
-                for http_method, handler_name in DEFAULT_ACTIONS.items()
-                if hasattr(cls, handler_name)
-            }
+            actions = dict(cls._default_actions)
 
         if "get" in actions and "head" not in actions:
             actions["head"] = actions["get"]
 
         http_methods = actions.keys()
+        handlers = _resolve_handlers(cls, actions)
 
         def view(ctx: Context, *args, **kwargs):
             self = cls(**initkwargs)
             self.action_map = actions
+            self._handlers = handlers
             ctx.environ["webspark.view_instance"] = self
 
             return self.dispatch(ctx, *args, **kwargs)
@@ -121,13 +164,18 @@ class View:
         update_wrapper(view, cls, updated=())
         view.http_methods = http_methods
 
+        if cacheable:
+            cls._as_view_cache = view
+
         return view
 
     def dispatch(self, ctx: Context, *args, **kwargs):
         """Dispatch the request to the appropriate handler method.
 
         This method sets up the view state and calls the handler method that
-        corresponds to the request's HTTP method.
+        corresponds to the request's HTTP method. Views built by as_view() call
+        handlers resolved once per view function; otherwise the handler is
+        looked up on the instance through action_map.
 
         Args:
             ctx: The context of the request being processed.
@@ -137,18 +185,20 @@ class View:
         Returns:
             Response: The HTTP response from the handler method.
         """
-        actions = self.action_map
+        method = ctx.method
+        handler = self._handlers.get(method)
 
-        if ctx.method not in actions:
-            raise HTTPException("Method not allowed.", status_code=405)
+        if handler is None and method not in self.action_map:
+            raise HTTPException(METHOD_NOT_ALLOWED, status_code=405)
 
         self.args = args
         self.kwargs = kwargs
         self.ctx = ctx
 
-        handler = getattr(self, actions[ctx.method])
+        if handler is not None:
+            return handler(self, ctx, *args, **kwargs)
 
-        return handler(ctx, *args, **kwargs)
+        return getattr(self, self.action_map[method])(ctx, *args, **kwargs)
 
     def build_ctx(self):
         """Build context dictionary for schema validation.
@@ -11,6 +11,7 @@ if TYPE_CHECKING:
 
 from ..http import Context
 from ..utils import HTTPException
+from ..utils.exceptions import ROUTE_NOT_FOUND
 from .trierouter import TrieRouter
 
 
@@ -80,8 +81,9 @@ class WebSpark:
             self.dispatch_request(ctx)
         except Exception as exc:
             if self.debug:
-                env["wsgi.errors"].write(traceback.format_exc())
-                env["wsgi.errors"].flush()
+                errors = env["wsgi.errors"]
+                errors.write(traceback.format_exc())
+                errors.flush()
             exc_handler = self.exceptions.get(
                 getattr(exc, "status_code", 500), self.default_exception_handler
             )
@@ -141,6 +143,7 @@ class WebSpark:
 
         def wrapper(func: Callable[[Context, Exception], None]):
             self.exceptions[status] = func
+            return func
 
         return wrapper
 
@@ -188,7 +191,7 @@ class WebSpark:
         path_, params = self.router.search(path_info)
 
         if path_ is None:
-            raise HTTPException("Route not found.", status_code=404)
+            raise HTTPException(ROUTE_NOT_FOUND, status_code=404)
 
         ctx.path_params = params
 
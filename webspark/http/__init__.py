@@ -1,5 +1,7 @@
 from .context import Context
+from .headers import HeadersView
 
 __all__ = [
     "Context",
+    "HeadersView",
 ]
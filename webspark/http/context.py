@@ -4,25 +4,123 @@ import io
 import json
 import mimetypes
 import os
+import re
+import stat
 import time
 from datetime import datetime
 from email.utils import formatdate
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
-from urllib.parse import parse_qs
+from urllib.parse import parse_qsl
 
 if TYPE_CHECKING:
     from ..core.views import View
     from ..core.wsgi import WebSpark
 
 from ..constants import BODY_METHODS, STATUS_CODE
-from ..http.cookie import parse_cookie, serialize_cookie
+from ..http.cookie import parse_cookie, parse_cookie_single, serialize_cookie
+from ..http.headers import HeadersView
 from ..http.multipart import MultipartParser
-from ..utils import HTTPException, cached_property, deserialize_json, serialize_json
+from ..utils import HTTPException, deserialize_json, serialize_json
 
 _SUPPORTED_CONTENT_TYPES = frozenset(
     ("application/x-www-form-urlencoded", "application/json", "multipart/form-data")
 )
 
+_UNSET = object()
+
+_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NONBLOCK", 0)
+
+_RANGE_RE = re.compile(r"\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*", re.IGNORECASE)
+
+
+def _parse_qs(qs: str, strict_parsing: bool = False) -> dict[str, Any]:
+    """Parse a query string into a dict, collecting repeated keys into lists."""
+    pairs = parse_qsl(qs, keep_blank_values=True, strict_parsing=strict_parsing)
+    params = dict(pairs)
+    if len(params) == len(pairs):
+        return params
+
+    params = {}
+    for key, value in pairs:
+        existing = params.get(key)
+        if existing is None:
+            params[key] = value
+        elif isinstance(existing, list):
+            existing.append(value)
+        else:
+            params[key] = [existing, value]
+    return params
+
+
+@lru_cache(maxsize=256)
+def _http_date(timestamp: int) -> str:
+    """Format a whole-second timestamp as an HTTP date.
+
+    HTTP dates have one-second resolution, so responses sent within the same
+    second (and files sharing an mtime) reuse one formatted value.
+    """
+    return formatdate(timestamp, usegmt=True)
+
+
+# Non-text/* types that are still served as text and so get a charset.
+_CHARSET_MIMES = frozenset(
+    ("application/javascript", "application/xml", "image/svg+xml")
+)
+
+
+@lru_cache(maxsize=256)
+def _mimetype_for_ext(ext: str, charset: str) -> str:
+    """Guess the MIME type served for a file extension.
+
+    The result only depends on the last extension (an encoding suffix such as
+    ``.gz`` overrides the type), so it is cached per extension and charset.
+    """
+    guessed, encoding = mimetypes.guess_type(f"file{ext}")
+    if encoding == "gzip":
+        guessed = "application/gzip"
+    elif encoding:
+        guessed = f"application/x-{encoding}"
+
+    if guessed and "charset=" not in guessed:
+        if guessed.startswith("text/") or guessed in _CHARSET_MIMES:
+            guessed += f"; charset={charset}"
+
+    return guessed or "application/octet-stream"
+
+
+@lru_cache(maxsize=256)
+def _accepted_types(accept: str) -> frozenset[str]:
+    """Parse an Accept header into the set of lowercase media types it lists.
+
+    Clients tend to send the same Accept header on every request, so the parsed
+    set is cached per header value.
+    """
+    return frozenset(
+        media_range.partition(";")[0].strip().lower()
+        for media_range in accept.split(",")
+    )
+
+
+# Lazily computed request attributes, mapped to the slot caching their value.
+_LAZY_SLOTS = {
+    "cookies": "_request_cookies",
+    "max_body_size": "_max_body_size",
+    "method": "_method",
+    "path": "_path",
+    "query_params": "_query_params",
+    "headers": "_headers",
+    "content_type": "_content_type",
+    "content_length": "_content_length",
+    "charset": "_charset",
+    "ip": "_ip",
+    "scheme": "_scheme",
+    "host": "_host",
+    "url": "_url",
+    "accept": "_accept",
+    "user_agent": "_user_agent",
+}
+
 
 class Context:
     """HTTP Context for WebSpark applications - combines Request and Response functionality.
@@ -59,7 +157,7 @@ class Context:
         method (str): The HTTP method (get, post, put, etc.).
         path (str): The request path.
         query_params (dict): Parsed query parameters.
-        headers (dict): Request headers.
+        headers (HeadersView): Mapping of lowercase request headers.
         content_type (str): Content-Type header value.
         content_length (int): Content-Length header value.
         charset (str): Character set from Content-Type header.
@@ -76,6 +174,31 @@ class Context:
         state (dict): A user-defined dictionary for internal state management.
     """
 
+    _BUF_READ_SIZE = 64 * 1024
+
+    __slots__ = (
+        "environ",
+        "_forms",
+        "_files",
+        "_body",
+        "_multipart_parser",
+        "_path_params",
+        "status",
+        "response_headers",
+        "_header_case",
+        "response_body",
+        "response_charset",
+        "_cookies",
+        "_responded",
+        "state",
+        "chunk_size",
+        "range_header",
+        "file_path",
+        "_wrapped_body",
+        "_stream_file",
+        *_LAZY_SLOTS.values(),
+    )
+
     def __init__(self, environ: dict[str, str]):
         """Initialize a Context object.
 
@@ -83,20 +206,64 @@ class Context:
             environ: WSGI environment dictionary.
         """
         self.environ = environ
+        self._request_cookies: dict[str, Any] = _UNSET
+        self._max_body_size: int = _UNSET
+        self._method: str = _UNSET
+        self._path: str = _UNSET
+        self._query_params: dict[str, Any] = _UNSET
+        self._headers: HeadersView = _UNSET
+        self._content_type: str | None = _UNSET
+        self._content_length: int = _UNSET
+        self._charset: str = _UNSET
+        self._ip: str = _UNSET
+        self._scheme: str = _UNSET
+        self._host: str = _UNSET
+        self._url: str = _UNSET
+        self._accept: str = _UNSET
+        self._user_agent: str = _UNSET
+
         self._forms: dict[str, Any] | None = None
         self._files: dict[str, Any] | None = None
         self._body: dict[str, Any] | None = None
         self._multipart_parser: MultipartParser | None = None
+        self._path_params: dict[str, str] = {}
 
         self.status = 200
         self.response_headers: dict[str, str] = {}
+        # Most responses set no cookies and only lowercase header names, so
+        # these two are allocated on first use.
+        self._header_case: dict[str, str] | None = None
         self.response_body: bytes | str | Any = b""
         self.response_charset = "utf-8"
-        self._cookies: list[str] = []
+        self._cookies: list[str] | tuple[()] = ()
         self._responded = False
+        self.chunk_size: int | None = None
+        self.range_header: str | None = None
+        self.file_path: str | None = None
+        self._wrapped_body: Any = None
+        self._stream_file: io.BufferedReader | None = None
 
         self.state: dict[Any, Any] = {}
 
+    def invalidate(self, name: str):
+        """Drop the cached value of a lazily computed attribute.
+
+        The value is computed again on next access.
+
+        Args:
+            name: The attribute name, e.g. "charset" or "headers".
+
+        Raises:
+            AttributeError: If name is not a lazily computed attribute.
+        """
+        try:
+            slot = _LAZY_SLOTS[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} has no lazy attribute {name!r}"
+            ) from None
+        setattr(self, slot, _UNSET)
+
     def __del__(self):
         if self._multipart_parser:
             self._multipart_parser._cleanup()
@@ -123,7 +290,9 @@ class Context:
         """Return a list of IPs from X-Forwarded-For header and REMOTE_ADDR."""
         x_forwarded_for = self.headers.get("x-forwarded-for")
         ips = (
-            [ip.strip() for ip in x_forwarded_for.split(",")] if x_forwarded_for else []
+            [ip for ip in map(str.strip, x_forwarded_for.split(",")) if ip]
+            if x_forwarded_for
+            else []
         )
         remote_addr = self.environ.get("REMOTE_ADDR")
         if remote_addr:
@@ -131,10 +300,11 @@ class Context:
         return ips
 
     def _is_proxy_trusted(self) -> bool:
-        if not getattr(self.webspark.config, "TRUST_PROXY", False):
+        config = self.webspark.config
+        if not getattr(config, "TRUST_PROXY", False):
             return False
 
-        trusted_proxies = getattr(self.webspark.config, "TRUSTED_PROXY_LIST", None)
+        trusted_proxies = getattr(config, "TRUSTED_PROXY_LIST", None)
         if trusted_proxies:
             remote_addr = self.environ.get("REMOTE_ADDR", "")
             if remote_addr not in trusted_proxies:
@@ -142,19 +312,46 @@ class Context:
 
         return True
 
-    @cached_property
+    @property
     def cookies(self) -> dict[str, Any]:
         """Parse and return cookies from the request.
 
         Returns:
             dict: Parsed cookies as key-value pairs.
         """
-        cookie_header = self.headers.get("cookie", "")
-        if not cookie_header:
-            return {}
+        if self._request_cookies is _UNSET:
+            cookie_header = self.headers.get("cookie", "")
+            if not cookie_header:
+                self._request_cookies = {}
+            else:
+                self._request_cookies = parse_cookie(
+                    cookie_header, self._cookie_secret()
+                )
+        return self._request_cookies
+
+    def get_cookie(self, name: str, default: Any = None) -> Any:
+        """Return a single cookie from the request.
+
+        Unless :attr:`cookies` was already parsed, only the requested cookie is
+        decoded.
+
+        Args:
+            name: Cookie name.
+            default: Value returned when the cookie is missing or invalid.
+
+        Returns:
+            Any: The cookie value, or ``default``.
+        """
+        if self._request_cookies is not _UNSET:
+            value = self._request_cookies.get(name)
+        else:
+            value = parse_cookie_single(
+                self.headers.get("cookie", ""), name, self._cookie_secret()
+            )
+        return default if value is None else value
 
-        secret = getattr(self.webspark.config, "SECRET", "!S!U!P!E!R!S!I!C!R!E!T!")
-        return parse_cookie(cookie_header, secret)
+    def _cookie_secret(self) -> str:
+        return getattr(self.webspark.config, "SECRET", "!S!U!P!E!R!S!I!C!R!E!T!")
 
     @property
     def view_instance(self) -> View:
@@ -179,13 +376,17 @@ class Context:
             )
 
         content_length = self.content_length
+        if not content_length and not self.environ.get("wsgi.input_terminated"):
+            self._body = {}
+            return self._body
+
         if content_length > self.max_body_size:
             raise HTTPException(
                 f"Request body too large. Maximum allowed: {self.max_body_size} bytes.",
                 status_code=413,
             )
 
-        if content_length and not self.content_type:
+        if not self.content_type:
             raise HTTPException("Missing Content-Type header.", status_code=400)
 
         content_type = self.content_type
@@ -199,23 +400,13 @@ class Context:
             self._body = self._forms
             return self._body or {}
 
-        stream = self.environ.get("wsgi.input", io.BytesIO())
-        raw_body = stream.read(content_length or 0)
+        raw_body = self._read_body(content_length)
 
         try:
             if content_type == "application/x-www-form-urlencoded":
-                self._body = {
-                    k: v[0] if len(v) == 1 else v
-                    for k, v in parse_qs(
-                        raw_body.decode("utf-8"), keep_blank_values=True
-                    ).items()
-                }
+                self._body = _parse_qs(raw_body.decode("utf-8"))
             elif content_type == "application/json":
-                self._body = (
-                    deserialize_json(raw_body.decode("utf-8"))
-                    if raw_body.strip()
-                    else {}
-                )
+                self._body = deserialize_json(raw_body) if raw_body.strip() else {}
         except (UnicodeDecodeError, json.JSONDecodeError, ValueError) as e:
             raise HTTPException(
                 f"Invalid request body format: {e}", status_code=400
@@ -223,6 +414,58 @@ class Context:
 
         return self._body or {}
 
+    def _read_body(self, content_length: int) -> bytes:
+        """Read the raw request body from wsgi.input in bounded chunks.
+
+        Without a Content-Length, the body is only read when the server marks the
+        input as terminated (``wsgi.input_terminated``). The running total is
+        checked against the maximum body size so oversized bodies are rejected
+        before they are read in full.
+
+        Args:
+            content_length: The declared Content-Length of the request.
+
+        Returns:
+            bytes: The raw request body.
+
+        Raises:
+            HTTPException: 413 if the body exceeds the maximum body size.
+        """
+        environ = self.environ
+        stream = environ.get("wsgi.input")
+        if stream is None:
+            return b""
+
+        if content_length:
+            remaining = content_length
+        elif environ.get("wsgi.input_terminated"):
+            remaining = -1
+        else:
+            return b""
+
+        max_body_size = self.max_body_size
+        buf_size = getattr(self.webspark.config, "BUF_READ_SIZE", self._BUF_READ_SIZE)
+        chunks = []
+        total = 0
+
+        while remaining:
+            chunk = stream.read(buf_size if remaining < 0 else min(buf_size, remaining))
+            if not chunk:
+                break
+
+            total += len(chunk)
+            if total > max_body_size:
+                raise HTTPException(
+                    f"Request body too large. Maximum allowed: {max_body_size} bytes.",
+                    status_code=413,
+                )
+
+            chunks.append(chunk)
+            if remaining > 0:
+                remaining = max(0, remaining - len(chunk))
+
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
     @property
     def files(self) -> dict[str, Any]:
         """Get parsed file uploads from multipart requests."""
@@ -234,79 +477,90 @@ class Context:
     @property
     def path_params(self) -> dict[str, str]:
         """Get path parameters extracted from the URL route."""
-        return getattr(self, "_path_params", {})
+        return self._path_params
 
     @path_params.setter
     def path_params(self, params: dict[str, str]):
         """Set path parameters extracted from the URL route."""
         self._path_params = params
 
-    @cached_property
+    @property
     def max_body_size(self) -> int:
         """Get the maximum allowed body size for the request in bytes."""
-        return getattr(self.webspark.config, "MAX_BODY_SIZE", 10 * 1024 * 1024)
+        if self._max_body_size is _UNSET:
+            self._max_body_size = getattr(
+                self.webspark.config, "MAX_BODY_SIZE", 10 * 1024 * 1024
+            )
+        return self._max_body_size
 
-    @cached_property
+    @property
     def method(self) -> str:
         """Get the HTTP method of the request."""
-        return self.environ.get("REQUEST_METHOD", "GET").lower()
+        if self._method is _UNSET:
+            self._method = self.environ.get("REQUEST_METHOD", "GET").lower()
+        return self._method
 
-    @cached_property
+    @property
     def path(self) -> str:
         """Get the request path."""
-        return self.environ.get("PATH_INFO", "/")
+        if self._path is _UNSET:
+            self._path = self.environ.get("PATH_INFO", "/")
+        return self._path
 
-    @cached_property
+    @property
     def query_params(self) -> dict[str, Any]:
         """Get parsed query parameters from the URL."""
+        if self._query_params is _UNSET:
+            self._query_params = self._parse_query_params()
+        return self._query_params
+
+    def _parse_query_params(self) -> dict[str, Any]:
         qs_raw = self.environ.get("QUERY_STRING", "")
         if not qs_raw:
             return {}
 
         try:
-            return {
-                k: v[0] if len(v) == 1 else v
-                for k, v in parse_qs(
-                    qs_raw, keep_blank_values=True, strict_parsing=True
-                ).items()
-            }
+            return _parse_qs(qs_raw, strict_parsing=True)
         except (ValueError, UnicodeDecodeError):
             return {}
 
-    @cached_property
-    def headers(self) -> dict[str, str]:
-        """Get HTTP headers from the request."""
-        headers = {
-            key[5:].replace("_", "-").lower(): value
-            for key, value in self.environ.items()
-            if key.startswith("HTTP_")
-        }
-
-        if "CONTENT_TYPE" in self.environ:
-            headers["content-type"] = self.environ["CONTENT_TYPE"]
-
-        if "CONTENT_LENGTH" in self.environ:
-            headers["content-length"] = self.environ["CONTENT_LENGTH"]
+    @property
+    def headers(self) -> HeadersView:
+        """Get HTTP headers from the request.
 
-        return headers
+        Returns a read-mostly ``HeadersView`` rather than a ``dict``; use
+        ``dict(ctx.headers)`` where a real dict is required.
+        """
+        if self._headers is _UNSET:
+            self._headers = HeadersView.from_environ(self.environ)
+        return self._headers
 
-    @cached_property
+    @property
     def content_type(self) -> str | None:
         """Get the Content-Type header value without parameters."""
-        content_type = self.environ.get("CONTENT_TYPE")
-        return content_type.split(";")[0].strip().lower() if content_type else None
+        if self._content_type is _UNSET:
+            content_type = self.environ.get("CONTENT_TYPE")
+            self._content_type = (
+                content_type.split(";")[0].strip().lower() if content_type else None
+            )
+        return self._content_type
 
-    @cached_property
+    @property
     def content_length(self) -> int:
         """Get the Content-Length header value."""
-        try:
-            return max(0, int(self.environ.get("CONTENT_LENGTH", 0) or 0))
-        except (ValueError, TypeError):
-            return 0
+        if self._content_length is _UNSET:
+            value = self.environ.get("CONTENT_LENGTH", "")
+            self._content_length = int(value) if value.isdecimal() else 0
+        return self._content_length
 
-    @cached_property
+    @property
     def charset(self) -> str:
         """Get the charset from the Content-Type header."""
+        if self._charset is _UNSET:
+            self._charset = self._parse_charset()
+        return self._charset
+
+    def _parse_charset(self) -> str:
         content_type = self.headers.get("content-type", "")
         if ";" not in content_type:
             return "utf-8"
@@ -319,49 +573,64 @@ class Context:
 
         return "utf-8"
 
-    @cached_property
+    @property
     def ip(self) -> str:
         """Get the client's IP address."""
-        if not getattr(self.webspark.config, "TRUST_PROXY", False):
-            return self.environ.get("REMOTE_ADDR", "")
+        if self._ip is _UNSET:
+            self._ip = self._resolve_ip()
+        return self._ip
+
+    def _resolve_ip(self) -> str:
+        config = self.webspark.config
+        remote_addr = self.environ.get("REMOTE_ADDR", "")
+        if not getattr(config, "TRUST_PROXY", False):
+            return remote_addr
 
+        headers = self.headers
         ips = self._get_forwarded_ips()
         if not ips:
-            x_real_ip = self.headers.get("x-real-ip")
+            x_real_ip = headers.get("x-real-ip")
             if x_real_ip:
                 return x_real_ip.strip()
-            return self.environ.get("REMOTE_ADDR", "")
+            return remote_addr
 
-        trusted_proxies = getattr(self.webspark.config, "TRUSTED_PROXY_LIST", None)
+        trusted_proxies = getattr(config, "TRUSTED_PROXY_LIST", None)
         if trusted_proxies:
-            if ips[-1] not in trusted_proxies:
-                return ips[-1]
-
             for ip in reversed(ips):
                 if ip not in trusted_proxies:
                     return ip
             return ips[0]
 
-        proxy_count = getattr(self.webspark.config, "TRUSTED_PROXY_COUNT", 0)
+        proxy_count = getattr(config, "TRUSTED_PROXY_COUNT", 0)
         if proxy_count > 0:
             if len(ips) > proxy_count:
                 return ips[-(proxy_count + 1)]
             else:
                 return ips[0]
 
-        x_forwarded_for = self.headers.get("x-forwarded-for")
+        x_forwarded_for = headers.get("x-forwarded-for")
         if x_forwarded_for:
             return x_forwarded_for.split(",")[0].strip()
 
-        x_real_ip = self.headers.get("x-real-ip")
+        x_real_ip = headers.get("x-real-ip")
         if x_real_ip:
             return x_real_ip.strip()
 
-        return self.environ.get("REMOTE_ADDR", "")
+        return remote_addr
 
-    @cached_property
+    @property
     def scheme(self) -> str:
         """Get the request scheme, respecting X-Forwarded-Proto."""
+        scheme = self._scheme
+        if scheme is _UNSET:
+            if getattr(self.webspark.config, "TRUST_PROXY", False):
+                scheme = self._forwarded_scheme()
+            else:
+                scheme = self.environ.get("wsgi.url_scheme", "http")
+            self._scheme = scheme
+        return scheme
+
+    def _forwarded_scheme(self) -> str:
         if self._is_proxy_trusted():
             x_forwarded_proto = self.headers.get("x-forwarded-proto")
             if x_forwarded_proto:
@@ -371,39 +640,58 @@ class Context:
     @property
     def is_secure(self) -> bool:
         """Check if the request is secure (HTTPS)."""
-        return self.scheme == "https"
+        scheme = self._scheme
+        if scheme is _UNSET:
+            scheme = self.scheme
+        return scheme == "https"
 
-    @cached_property
+    @property
     def host(self) -> str:
         """Get the request host, respecting X-Forwarded-Host."""
-        if self._is_proxy_trusted():
-            x_forwarded_host = self.headers.get("x-forwarded-host")
+        if self._host is _UNSET:
+            x_forwarded_host = (
+                self.headers.get("x-forwarded-host")
+                if self._is_proxy_trusted()
+                else None
+            )
             if x_forwarded_host:
-                return x_forwarded_host.split(",")[0].strip()
-        return self.environ.get("HTTP_HOST") or self.environ.get("SERVER_NAME", "")
+                self._host = x_forwarded_host.split(",")[0].strip()
+            else:
+                environ = self.environ
+                self._host = environ.get("HTTP_HOST") or environ.get("SERVER_NAME", "")
+        return self._host
 
-    @cached_property
+    @property
     def url(self) -> str:
         """Get the full request URL."""
+        if self._url is not _UNSET:
+            return self._url
+
         host = self.host
         if not host:
-            return self.path
+            url = self.path
+        else:
+            url = f"{self.scheme}://{host}{self.path}"
+            query_string = self.environ.get("QUERY_STRING")
+            if query_string:
+                url += f"?{query_string}"
 
-        url = f"{self.scheme}://{host}{self.path}"
-        query_string = self.environ.get("QUERY_STRING")
-        if query_string:
-            url += f"?{query_string}"
+        self._url = url
         return url
 
-    @cached_property
+    @property
     def accept(self) -> str:
         """Get the 'Accept' header."""
-        return self.headers.get("accept", "")
+        if self._accept is _UNSET:
+            self._accept = self.headers.get("accept", "")
+        return self._accept
 
-    @cached_property
+    @property
     def user_agent(self) -> str:
         """Get the 'User-Agent' header."""
-        return self.headers.get("user-agent", "")
+        if self._user_agent is _UNSET:
+            self._user_agent = self.headers.get("user-agent", "")
+        return self._user_agent
 
     # -
 
@@ -414,7 +702,12 @@ class Context:
             name: Header name.
             value: Header value.
         """
-        self.response_headers[name.lower()] = value
+        key = name.lower()
+        self.response_headers[key] = value
+        if key != name:
+            if self._header_case is None:
+                self._header_case = {}
+            self._header_case[key] = name
 
     def get_header(self, name: str) -> str | None:
         """Get a response header value.
@@ -433,7 +726,10 @@ class Context:
         Args:
             name: Header name to delete.
         """
-        self.response_headers.pop(name.lower(), None)
+        key = name.lower()
+        self.response_headers.pop(key, None)
+        if self._header_case:
+            self._header_case.pop(key, None)
 
     def set_cookie(
         self,
@@ -455,25 +751,25 @@ class Context:
             path: Cookie path.
             max_age: Maximum age in seconds.
             same_site: SameSite attribute.
-            secrets: List of secret keys for signing.
             secure: Secure flag.
             http_only: HttpOnly flag.
             expires: Expiration date.
         """
-        secret = getattr(self.webspark.config, "SECRET", "!S!U!P!E!R!S!I!C!R!E!T!")
-        self._cookies.append(
-            serialize_cookie(
-                name,
-                data,
-                path=path,
-                max_age=max_age,
-                same_site=same_site,
-                secret=secret,
-                secure=secure,
-                http_only=http_only,
-                expires=expires,
-            )
+        cookie = serialize_cookie(
+            name,
+            data,
+            path=path,
+            max_age=max_age,
+            same_site=same_site,
+            secret=self._cookie_secret(),
+            secure=secure,
+            http_only=http_only,
+            expires=expires,
         )
+        if self._cookies:
+            self._cookies.append(cookie)
+        else:
+            self._cookies = [cookie]
 
     def delete_cookie(self, name: str):
         """Delete a cookie by setting its expiration to the past.
@@ -600,10 +896,10 @@ class Context:
             start, end = self._parse_range(self.range_header, total_size)
             headers["content-range"] = f"bytes {start}-{end}/{total_size}"
             headers["content-length"] = str(end - start + 1)
-            return [content[start : end + 1]], 206, headers, content_type
+            return (content[start : end + 1],), 206, headers, content_type
 
         headers["content-length"] = str(total_size)
-        return [content], status, headers, content_type
+        return (content,), status, headers, content_type
 
     def _handle_stream_file(
         self,
@@ -615,33 +911,76 @@ class Context:
     ):
         """Handle streaming response when content is a file path."""
         path = os.fspath(path)
-        if not os.path.exists(path) or not os.path.isfile(path):
-            raise HTTPException("File does not exist.", status_code=404)
-
-        if not os.access(path, os.R_OK):
+        # Open the file once and take everything else from fstat(), instead of
+        # separate exists/isfile/access/stat calls on the path. O_NONBLOCK
+        # keeps a FIFO from blocking the open; it has no effect on regular files.
+        try:
+            fd = os.open(path, _OPEN_FLAGS)
+        except PermissionError:
             raise HTTPException(
                 "You do not have permission to access this file.", status_code=403
+            ) from None
+        except OSError:
+            raise HTTPException("File does not exist.", status_code=404) from None
+
+        try:
+            stats = os.fstat(fd)
+            if not stat.S_ISREG(stats.st_mode):
+                raise HTTPException("File does not exist.", status_code=404)
+            f = os.fdopen(fd, "rb")
+        except BaseException:
+            os.close(fd)
+            raise
+
+        try:
+            return self._stream_open_file(
+                f, path, stats, status, headers, content_type, download
             )
+        except BaseException:
+            f.close()
+            raise
 
+    def _stream_open_file(
+        self,
+        f: io.BufferedReader,
+        path: str,
+        stats: os.stat_result,
+        status: int,
+        headers: dict[str, str],
+        content_type: str | None,
+        download: str | None,
+    ):
+        """Build the streaming response for an opened regular file."""
         self.file_path = path
         content_type = self._detect_stream_mimetype(path, content_type)
-
-        stats = os.stat(path)
         file_size = stats.st_size
 
-        headers["last-modified"] = formatdate(stats.st_mtime, usegmt=True)
-        headers["date"] = formatdate(time.time(), usegmt=True)
+        headers["last-modified"] = _http_date(int(stats.st_mtime))
+        headers["date"] = _http_date(int(time.time()))
         if download:
             headers["content-disposition"] = f'attachment; filename="{download}"'
 
+        start, end = 0, file_size - 1
         if self.range_header:
             start, end = self._parse_range(self.range_header, file_size)
             headers["content-range"] = f"bytes {start}-{end}/{file_size}"
             headers["content-length"] = str(end - start + 1)
-            return self._file_iterator(start, end), 206, headers, content_type
+            status = 206
+        else:
+            headers["content-length"] = str(file_size)
+
+        self._stream_file = f
+        # Let the server send the file itself (e.g. with os.sendfile) when it
+        # provides a file wrapper and the response runs to the end of the file.
+        file_wrapper = self.environ.get("wsgi.file_wrapper")
+        if file_wrapper is not None and end == file_size - 1:
+            f.seek(start)
+            # Wrappers need not be iterable (gunicorn's only defines
+            # __getitem__), so as_wsgi recognizes this one by identity.
+            self._wrapped_body = file_wrapper(f, self.chunk_size)
+            return self._wrapped_body, status, headers, content_type
 
-        headers["content-length"] = str(file_size)
-        return self._file_iterator(), status, headers, content_type
+        return self._file_iterator(start, end, f), status, headers, content_type
 
     def _handle_stream_iterable(
         self,
@@ -658,45 +997,42 @@ class Context:
         """Guess MIME type from file extension or fallback to default."""
         if content_type:
             return content_type
-
-        guessed, encoding = mimetypes.guess_type(path)
-        if encoding == "gzip":
-            guessed = "application/gzip"
-        elif encoding:
-            guessed = f"application/x-{encoding}"
-
-        if guessed and "charset=" not in guessed:
-            if guessed.startswith("text/") or guessed == "application/javascript":
-                guessed += f"; charset={self.response_charset}"
-
-        return guessed or "application/octet-stream"
+        return _mimetype_for_ext(os.path.splitext(path)[1], self.response_charset)
 
     def _parse_range(self, range_header: str, total_size: int):
         """Parse an HTTP Range header."""
-        try:
-            unit, _, range_spec = range_header.partition("=")
-            if unit.strip().lower() != "bytes":
-                raise ValueError
-            start_str, _, end_str = range_spec.partition("-")
+        match = _RANGE_RE.fullmatch(range_header)
+        if match is None:
+            raise HTTPException("Invalid Range header.", status_code=416)
 
-            start = int(start_str) if start_str else 0
-            end = int(end_str) if end_str else total_size - 1
+        start_str, end_str = match.groups()
+        start = int(start_str) if start_str else 0
+        end = int(end_str) if end_str else total_size - 1
 
-            if start > end or start >= total_size:
-                raise ValueError
+        if start > end or start >= total_size:
+            raise HTTPException("Invalid Range header.", status_code=416)
 
-            return start, min(end, total_size - 1)
-        except ValueError as e:
-            raise HTTPException("Invalid Range header.", status_code=416) from e
+        return start, min(end, total_size - 1)
 
-    def _file_iterator(self, start: int = 0, end: int | None = None):
-        """Yield file content in chunks."""
-        end = end if end is not None else os.stat(self.file_path).st_size - 1
-        with open(self.file_path, "rb") as f:
+    def _file_iterator(
+        self,
+        start: int = 0,
+        end: int | None = None,
+        file: io.BufferedReader | None = None,
+    ):
+        """Yield file content in chunks.
+
+        Chunks are read with bounded read() calls rather than from a memory map:
+        a mapped file that is truncated while it streams raises SIGBUS, while a
+        read just comes up short and ends the response. An already opened
+        ``file`` is used (and closed) instead of opening ``file_path``.
+        """
+        chunk_size = self.chunk_size
+        with open(self.file_path, "rb") if file is None else file as f:
             f.seek(start)
-            remaining = end - start + 1
+            remaining = end - start + 1 if end is not None else float("inf")
             while remaining > 0:
-                chunk = f.read(min(self.chunk_size, remaining))
+                chunk = f.read(min(chunk_size, remaining))
                 if not chunk:
                     break
                 yield chunk
@@ -722,7 +1058,7 @@ class Context:
             return body
         if isinstance(body, str):
             return body.encode(self.response_charset)
-        if hasattr(body, "__bytes__"):
+        if isinstance(body, bytearray | memoryview) or hasattr(body, "__bytes__"):
             return bytes(body)
 
         content_type = self.get_header("content-type") or ""
@@ -731,33 +1067,41 @@ class Context:
 
         return str(body).encode(self.response_charset)
 
-    @cached_property
-    def _body_bytes(self) -> bytes:
-        """Convert response body to bytes."""
-        return self._to_bytes(self.response_body)
-
     def as_wsgi(self):
         """Convert context to WSGI format.
 
         Returns:
             tuple: A tuple of (status_string, headers_list, body_iterator).
         """
-        status_str = STATUS_CODE.get(self.status, f"{self.status} Unknown")
-        headers_list = list(self.response_headers.items())
+        status_str = STATUS_CODE.get(self.status) or f"{self.status} Unknown"
+        header_case = self._header_case
+        if header_case:
+            headers_list = [
+                (header_case.get(name, name), value)
+                for name, value in self.response_headers.items()
+            ]
+        else:
+            headers_list = list(self.response_headers.items())
 
-        if hasattr(self, "chunk_size") and hasattr(self.response_body, "__iter__"):
+        body = self.response_body
+        # Server file wrappers go back to the server untouched, iterable or not.
+        if (body is not None and body is self._wrapped_body) or (
+            self.chunk_size is not None and hasattr(body, "__iter__")
+        ):
             for cookie in self._cookies:
                 headers_list.append(("Set-Cookie", cookie))
-            return status_str, headers_list, self.response_body
+            return status_str, headers_list, body
         else:
-            body_bytes = self._body_bytes
+            # Encoded only here, so in-place changes made to the body before
+            # then (e.g. by a plugin after the view) are sent.
+            body_bytes = body if type(body) is bytes else self._to_bytes(body)
             if "content-length" not in self.response_headers:
                 headers_list.append(("Content-Length", str(len(body_bytes))))
 
             for cookie in self._cookies:
                 headers_list.append(("Set-Cookie", cookie))
 
-            return status_str, headers_list, [body_bytes]
+            return status_str, headers_list, (body_bytes,)
 
     @property
     def responded(self) -> bool:
@@ -770,12 +1114,25 @@ class Context:
             raise RuntimeError("Response has already been set for this context.")
 
     def reset_response(self):
-        """Reset the response to allow setting a new one."""
+        """Reset the response to allow setting a new one.
+
+        A body being replaced is closed first, along with a file opened by
+        stream(): a generator that has not started cannot close its file.
+        """
+        close = getattr(self.response_body, "close", None)
+        if close is not None:
+            close()
+        if self._stream_file is not None:
+            self._stream_file.close()
+            self._stream_file = None
         self.status = 200
         self.response_headers.clear()
+        self._header_case = None
         self.response_body = b""
-        self._cookies.clear()
+        self._cookies = ()
         self._responded = False
+        self.chunk_size = None
+        self._wrapped_body = None
 
     def is_ajax(self) -> bool:
         """Check if the request is an AJAX request."""
@@ -783,8 +1140,8 @@ class Context:
 
     def accepts(self, content_type: str) -> bool:
         """Check if the client accepts a specific content type."""
-        accept_header = self.accept.lower()
-        return content_type.lower() in accept_header or "*/*" in accept_header
+        types = _accepted_types(self.accept)
+        return "*/*" in types or content_type.lower() in types
 
     def wants_json(self) -> bool:
         """Check if the client prefers JSON response."""
@@ -1,12 +1,71 @@
 import base64
 import hashlib
 import hmac
-from datetime import datetime, timedelta
-from http.cookies import SimpleCookie
+import string
+import time
+from datetime import datetime
+from functools import lru_cache
+from http.cookies import CookieError
 from typing import Any
 
 from ..utils.json import deserialize_json, serialize_json
 
+# Cookie attribute names, which are never parsed as cookies.
+_RESERVED_NAMES = frozenset(
+    (
+        "expires",
+        "path",
+        "comment",
+        "domain",
+        "max-age",
+        "secure",
+        "httponly",
+        "version",
+        "samesite",
+    )
+)
+
+# Characters allowed unquoted in cookie names and values (as in http.cookies).
+_LEGAL_CHARS = frozenset(string.ascii_letters + string.digits + "!#$%&'*+-.^_`|~:")
+
+# Day and month names for cookie dates, which must not follow the locale.
+_DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = (
+    "Jan",
+    "Feb",
+    "Mar",
+    "Apr",
+    "May",
+    "Jun",
+    "Jul",
+    "Aug",
+    "Sep",
+    "Oct",
+    "Nov",
+    "Dec",
+)
+
+
+@lru_cache(maxsize=64)
+def _format_gmt(timestamp: int) -> str:
+    """
+    Format a Unix timestamp as a cookie expires date in GMT.
+
+    Cookies set with the same lifetime within the same second expire at the
+    same timestamp, so the formatted value is cached.
+
+    Args:
+        timestamp: Seconds since the epoch
+
+    Returns:
+        A string like "Mon, 25-Dec-2023 10:30:45 GMT"
+    """
+    tm = time.gmtime(timestamp)
+    return (
+        f"{_DAYS[tm.tm_wday]}, {tm.tm_mday:02d}-{_MONTHS[tm.tm_mon - 1]}-"
+        f"{tm.tm_year} {tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d} GMT"
+    )
+
 
 def _make_expires(date: datetime | int) -> str:
     """
@@ -22,45 +81,154 @@ def _make_expires(date: datetime | int) -> str:
         ValueError: If date is neither datetime nor int
     """
     if isinstance(date, datetime):
-        return date.strftime("%a, %d-%b-%Y %H:%M:%S GMT")
-    elif isinstance(date, int):
-        return (datetime.now() + timedelta(seconds=date)).strftime(
-            "%a, %d-%b-%Y %H:%M:%S GMT"
+        return (
+            f"{_DAYS[date.weekday()]}, {date.day:02d}-{_MONTHS[date.month - 1]}-"
+            f"{date.year} {date.hour:02d}:{date.minute:02d}:{date.second:02d} GMT"
         )
+    elif isinstance(date, int):
+        return _format_gmt(int(time.time()) + date)
     raise ValueError("Date must be datetime or int.")
 
 
-def _sign(data: str, secret: str) -> str:
+@lru_cache(maxsize=16)
+def _hmac_prototype(secret: str) -> hmac.HMAC:
+    """
+    Return an HMAC-SHA256 object keyed with the given secret.
+
+    Keying an HMAC hashes the padded key into its inner and outer states; doing
+    it once per secret lets every signature start from a copy of that state.
+
+    Args:
+        secret: The secret key
+
+    Returns:
+        An HMAC object with no data fed into it, to be copied before use
+    """
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+
+# Length of an unpadded base64 HMAC-SHA256 signature.
+_SIG_LEN = 43
+
+
+def _b64encode(data: bytes) -> str:
+    """
+    Encode bytes as unpadded URL-safe base64.
+
+    The padding is implied by the length, and leaving it out keeps cookie
+    values free of "=" so they never need quoting.
+
+    Args:
+        data: The bytes to encode
+
+    Returns:
+        The base64 string without trailing "=" padding
+    """
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    """
+    Decode URL-safe base64, with or without its "=" padding.
+
+    Args:
+        data: The base64 string to decode
+
+    Returns:
+        The decoded bytes
+    """
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _digest(data: str | bytes, secret: str) -> bytes:
+    """
+    Compute the raw HMAC-SHA256 digest of the given data.
+
+    Args:
+        data: The data to sign, as text or UTF-8 bytes
+        secret: The secret key to use for signing
+
+    Returns:
+        The 32-byte digest
+    """
+    mac = _hmac_prototype(secret).copy()
+    mac.update(data.encode() if isinstance(data, str) else data)
+    return mac.digest()
+
+
+def _sign(data: str | bytes, secret: str) -> str:
     """
     Create an HMAC signature for the given data using the provided secret.
 
     Args:
-        data: The data to sign
+        data: The data to sign, as text or UTF-8 bytes
         secret: The secret key to use for signing
 
     Returns:
-        A base64-encoded signature string
+        An unpadded base64-encoded signature string
     """
-    signature = hmac.new(secret.encode(), data.encode(), hashlib.sha256).digest()
-    return base64.urlsafe_b64encode(signature).decode()
+    return _b64encode(_digest(data, secret))
 
 
-def _verify(data: str, signature: str, secret: str):
+def _verify(data: str | bytes, signature: str, secret: str) -> bool:
     """
-    Verify an HMAC signature against a list of possible secrets.
+    Verify an HMAC signature against the given secret.
 
     Args:
-        data: The original data that was signed
+        data: The original data that was signed, as text or UTF-8 bytes
         signature: The signature to verify
         secret: The secret key to use for verification
 
     Returns:
-        True if the signature is valid for any of the secrets, False otherwise
+        True if the signature is valid for the secret, False otherwise
+    """
+    # Padded signatures (issued before padding was dropped) still end in "=".
+    signature = signature.rstrip("=")
+    if len(signature) != _SIG_LEN:
+        return False
+    try:
+        provided = _b64decode(signature)
+    except ValueError:
+        return False
+    return hmac.compare_digest(_digest(data, secret), provided)
+
+
+@lru_cache(maxsize=64)
+def _cookie_attributes(
+    path: str, max_age: int, same_site: str, secure: bool, http_only: bool
+) -> str:
     """
-    expected_signature = _sign(data, secret)
-    if hmac.compare_digest(expected_signature, signature):
-        return True
-    return False
+    Build the Set-Cookie attributes that do not depend on the current time.
+
+    Applications use a handful of option combinations, usually the defaults,
+    so the formatted attributes are cached per combination.
+
+    Args:
+        path: Cookie path attribute
+        max_age: Cookie max-age in seconds
+        same_site: SameSite attribute
+        secure: Whether to set Secure flag
+        http_only: Whether to set HttpOnly flag
+
+    Returns:
+        The attributes, each prefixed with "; "
+    """
+    parts = []
+    if http_only:
+        parts.append("; HttpOnly")
+    if max_age:
+        parts.append(
+            f"; Max-Age={max_age:d}"
+            if isinstance(max_age, int)
+            else f"; Max-Age={max_age}"
+        )
+    if path:
+        parts.append(f"; Path={path}")
+    if same_site:
+        parts.append(f"; SameSite={same_site}")
+    if secure:
+        parts.append("; Secure")
+    return "".join(parts)
 
 
 def serialize_cookie(
@@ -92,32 +260,103 @@ def serialize_cookie(
     Returns:
         A formatted cookie string ready for Set-Cookie header
     """
-    serialized_data = serialize_json(data).decode("utf-8")
-
+    payload = serialize_json(data)
+    serialized_data = _b64encode(payload)
     if secret:
-        signature = _sign(serialized_data, secret)
-        serialized_data = base64.urlsafe_b64encode(serialized_data.encode()).decode()
-        serialized_data = f"{serialized_data}.{signature}"
-    else:
-        serialized_data = base64.urlsafe_b64encode(serialized_data.encode()).decode()
+        serialized_data = f"{serialized_data}.{_sign(payload, secret)}"
 
-    cookie = SimpleCookie()
-    cookie[name] = serialized_data
+    if not name or name.lower() in _RESERVED_NAMES or not _LEGAL_CHARS.issuperset(name):
+        raise CookieError(f"Illegal key {name!r}")
 
+    # Attributes follow SimpleCookie's (sorted) output order, in which the
+    # per-call expires date comes before all the cacheable ones.
+    attributes = _cookie_attributes(path, max_age, same_site, secure, http_only)
     if expires:
-        cookie[name]["Expires"] = _make_expires(expires)
-    if max_age:
-        cookie[name]["Max-Age"] = max_age
-    if path:
-        cookie[name]["Path"] = path
-    if http_only:
-        cookie[name]["HttpOnly"] = http_only
-    if secure:
-        cookie[name]["Secure"] = secure
-    if same_site:
-        cookie[name]["SameSite"] = same_site
+        return f"{name}={serialized_data}; expires={_make_expires(expires)}{attributes}"
+    return f"{name}={serialized_data}{attributes}"
+
+
+def _unquote(value: str) -> str:
+    """
+    Strip whitespace and surrounding double quotes from a raw cookie value.
+
+    Values written by serialize_cookie are base64 and never contain escapes,
+    so no unescaping is done.
+
+    Args:
+        value: The raw cookie value
+
+    Returns:
+        The unwrapped value
+    """
+    value = value.strip()
+    if len(value) > 1 and value[0] == '"' and value[-1] == '"':
+        return value[1:-1]
+    return value
+
+
+def _split_cookie_header(header: str) -> dict[str, str]:
+    """
+    Split a Cookie header into raw name/value pairs.
+
+    Args:
+        header: The Cookie header value to split
+
+    Returns:
+        A dictionary mapping cookie names to their unquoted raw values
+    """
+    values: dict[str, str] = {}
+
+    for item in header.split(";"):
+        name, sep, value = item.partition("=")
+        if not sep:
+            continue
+        name = name.strip()
+        if name.lower() in _RESERVED_NAMES:
+            continue
+        values[name] = _unquote(value)
+
+    return values
+
+
+def _decode_cookie_value(value: str, secret: str = None) -> Any:
+    """
+    Decode a single raw cookie value written by serialize_cookie.
+
+    Args:
+        value: The unquoted cookie value
+        secret: Secret key for verifying signed cookies (optional)
+
+    Returns:
+        The deserialized value, or None if it is invalid or tampered with
+    """
+    data, sep, signature = value.rpartition(".")
+    try:
+        if not sep:
+            return deserialize_json(_b64decode(value))
+        payload = _b64decode(data)
+        if _verify(payload, signature, secret):
+            return deserialize_json(payload)
+    except Exception:
+        pass
+    return None
 
-    return cookie.output(header="", sep="").strip()
+
+def parse_cookie_value(value: str, secret: str = None):
+    """
+    Parse a single cookie value, without the header around it.
+
+    Useful when the value was already extracted from the Cookie header, e.g.
+    by a server that splits cookies itself.
+
+    Args:
+        value: The raw cookie value, optionally double-quoted
+        secret: Secret key for verifying signed cookies (optional)
+
+    Returns:
+        The deserialized value, or None if it is invalid or tampered with
+    """
+    return _decode_cookie_value(_unquote(value), secret)
 
 
 def parse_cookie(header: str, secret: str = None):
@@ -132,26 +371,40 @@ def parse_cookie(header: str, secret: str = None):
         A dictionary mapping cookie names to their deserialized values.
         Invalid or tampered cookies will have None as their value.
     """
-    cookie = SimpleCookie(header)
-    parsed: dict[str, Any] = {}
-
-    for name, morsel in cookie.items():
-        value = morsel.value
-
-        if "." in value:
-            try:
-                data, signature = value.rsplit(".", 1)
-                data = base64.urlsafe_b64decode(data).decode()
-                if _verify(data, signature, secret):
-                    parsed[name] = deserialize_json(data)
-                else:
-                    parsed[name] = None
-            except Exception:
-                parsed[name] = None
-        else:
-            try:
-                parsed[name] = deserialize_json(base64.urlsafe_b64decode(value))
-            except Exception:
-                parsed[name] = None
-
-    return parsed
+    if not header:
+        return {}
+
+    return {
+        name: _decode_cookie_value(value, secret)
+        for name, value in _split_cookie_header(header).items()
+    }
+
+
+def parse_cookie_single(header: str, name: str, secret: str = None):
+    """
+    Parse a single cookie from a Cookie header string.
+
+    Only the requested cookie is decoded, so unrelated cookies sent along
+    with it cost nothing but the scan. When the name appears more than once
+    the last value wins, as with parse_cookie.
+
+    Args:
+        header: The Cookie header value to parse
+        name: The name of the cookie to return
+        secret: Secret key for verifying signed cookies (optional)
+
+    Returns:
+        The deserialized value, or None if the cookie is missing, invalid or
+        tampered with
+    """
+    if not header or not name or name not in header:
+        return None
+    if name.lower() in _RESERVED_NAMES:
+        return None
+
+    for item in reversed(header.split(";")):
+        key, sep, value = item.partition("=")
+        if sep and key.strip() == name:
+            return _decode_cookie_value(_unquote(value), secret)
+
+    return None
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Any
+
+# CGI variables carrying request headers without the HTTP_ prefix. They take
+# precedence over a (non-standard) HTTP_-prefixed variable of the same header.
+_CGI_HEADERS = (
+    ("CONTENT_TYPE", "HTTP_CONTENT_TYPE", "content-type"),
+    ("CONTENT_LENGTH", "HTTP_CONTENT_LENGTH", "content-length"),
+)
+
+
+class HeadersView(MutableMapping):
+    """Mapping of request headers backed by a tuple of ``(name, value)`` pairs.
+
+    Requests usually carry a handful of headers and handlers only read a few of
+    them, so a linear scan over the pairs is cheaper than hashing every header
+    into a dict up front. Names are expected to be lowercase. Assignments are
+    supported but rebuild the tuple, so they are meant for occasional use.
+
+    ``Context.headers`` used to return a plain ``dict``. ``copy()`` and the
+    ``|`` operator still return dicts, but code that needs an actual ``dict``
+    (e.g. ``json.dumps``) should convert the view with ``dict(headers)``.
+
+    Example:
+        headers = HeadersView((("host", "example.com"), ("accept", "*/*")))
+        headers["host"]  # "example.com"
+        headers.get("cookie", "")  # ""
+        dict(headers)  # {"host": "example.com", "accept": "*/*"}
+        headers | {"accept": "text/html"}  # {"host": ..., "accept": "text/html"}
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: tuple[tuple[str, str], ...] = ()):
+        """Initialize a HeadersView.
+
+        Args:
+            items: Lowercase ``(name, value)`` header pairs.
+        """
+        self._items = items
+
+    @classmethod
+    def from_environ(cls, environ: dict[str, Any]) -> HeadersView:
+        """Build a view of the request headers found in a WSGI environment.
+
+        Args:
+            environ: WSGI environment dictionary.
+
+        Returns:
+            HeadersView: The request headers, including Content-Type and
+            Content-Length when the server provides them.
+        """
+        # One pass over environ for the HTTP_ variables; the two CGI variables
+        # are then probed directly instead of being tested for on every key.
+        items = [
+            (key[5:].lower().replace("_", "-"), value)
+            for key, value in environ.items()
+            if key[:5] == "HTTP_"
+        ]
+        for cgi_key, http_key, name in _CGI_HEADERS:
+            if http_key in environ:
+                items = [item for item in items if item[0] != name]
+                items.append((name, environ.get(cgi_key, environ[http_key])))
+            elif cgi_key in environ:
+                items.append((name, environ[cgi_key]))
+        return cls(tuple(items))
+
+    def __getitem__(self, name: str) -> str:
+        for key, value in self._items:
+            if key == name:
+                return value
+        raise KeyError(name)
+
+    def __setitem__(self, name: str, value: str):
+        items = self._items
+        for i, (key, _) in enumerate(items):
+            if key == name:
+                self._items = (*items[:i], (name, value), *items[i + 1 :])
+                return
+        self._items = (*items, (name, value))
+
+    def __delitem__(self, name: str):
+        items = tuple(item for item in self._items if item[0] != name)
+        if len(items) == len(self._items):
+            raise KeyError(name)
+        self._items = items
+
+    def get(self, name: str, default: Any = None) -> Any:
+        for key, value in self._items:
+            if key == name:
+                return value
+        return default
+
+    def __contains__(self, name: object) -> bool:
+        for key, _ in self._items:
+            if key == name:
+                return True
+        return False
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key, _ in self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def copy(self) -> dict[str, str]:
+        """Return the headers as a new dict."""
+        return dict(self._items)
+
+    def __or__(self, other: Any) -> dict[str, str]:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return {**dict(self._items), **other}
+
+    def __ror__(self, other: Any) -> dict[str, str]:
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return {**other, **dict(self._items)}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self._items)!r})"
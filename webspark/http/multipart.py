@@ -3,8 +3,9 @@ from email.message import Message
 from enum import Enum
 from tempfile import NamedTemporaryFile
 from typing import IO, TYPE_CHECKING, Literal
+from urllib.parse import unquote
 
-from ..utils import HTTPException
+from ..utils import HTTPException, cached_property
 
 if TYPE_CHECKING:
     from tempfile import _TemporaryFileWrapper
@@ -16,11 +17,106 @@ class DelimiterEnum(bytes, Enum):
     LF = b"\n"
 
 
+# RFC 2046 limits boundaries to 70 characters; some slack is left for clients
+# that do not follow it, while keeping the search needle bounded.
+MAX_BOUNDARY_LENGTH = 256
+
+_CONTENT_DISPOSITION = b"content-disposition"
+_CONTENT_TYPE = b"content-type"
+
 EncodingErrors = Literal["strict", "ignore", "replace"]
 FileFields = dict[str, dict | list[dict]]
 FormFields = dict[str, str | list]
 
 
+def _header_params(value: str) -> dict[str, str]:
+    """Parse the ``key=value`` parameters following a header's main value.
+
+    Parameter names are lowercased and only the first occurrence of each is
+    kept. Quoted values are unquoted the way ``email.message.Message`` does.
+    RFC 5987 extended parameters (``filename*=UTF-8''...``) are decoded and
+    take precedence over the plain parameter of the same name; one that cannot
+    be decoded is ignored.
+
+    Args:
+        value: Header value, e.g. ``form-data; name="field"``.
+
+    Returns:
+        dict: Mapping of parameter names to their values.
+    """
+    params: dict[str, str] = {}
+    extended: dict[str, str] = {}
+    length = len(value)
+    pos = value.find(";")
+
+    while 0 <= pos < length:
+        start = pos + 1
+        eq = value.find("=", start)
+        if eq < 0:
+            break
+        semi = value.find(";", start)
+        if 0 <= semi < eq:
+            pos = semi
+            continue
+
+        key = value[start:eq].strip().lower()
+        i = eq + 1
+        while i < length and value[i] in " \t":
+            i += 1
+
+        if value[i : i + 1] == '"':
+            end = value.find('"', i + 1)
+            while end > 0:
+                # The quote is escaped only by an odd run of backslashes.
+                j = end
+                while value[j - 1] == "\\":
+                    j -= 1
+                if (end - j) % 2 == 0:
+                    break
+                end = value.find('"', end + 1)
+            if end < 0:
+                end = length
+            param = value[i + 1 : end]
+            if "\\" in param:
+                param = param.replace("\\\\", "\\").replace('\\"', '"')
+            pos = value.find(";", end)
+        else:
+            pos = value.find(";", i)
+            param = value[i : pos if pos >= 0 else length].strip()
+
+        if key[-1:] == "*":
+            charset, _, rest = param.partition("'")
+            _, sep, encoded = rest.partition("'")
+            if sep and key not in extended:
+                try:
+                    extended[key] = unquote(encoded, charset, "strict")
+                except (LookupError, UnicodeDecodeError):
+                    pass
+        else:
+            params.setdefault(key, param)
+
+    for key, param in extended.items():
+        params[key[:-1]] = param
+    return params
+
+
+def _media_type(value: str | None) -> str:
+    """Return the lowercase media type of a Content-Type value.
+
+    Args:
+        value: Content-Type header value, or None if the header is missing.
+
+    Returns:
+        str: The media type, or "text/plain" when it is missing or invalid.
+    """
+    if value is None:
+        return "text/plain"
+    media_type = value.partition(";")[0].strip().lower()
+    if media_type.count("/") != 1:
+        return "text/plain"
+    return media_type
+
+
 class MultipartParser:
     """Parser for HTTP multipart/form-data requests.
 
@@ -57,7 +153,7 @@ class MultipartParser:
         content_length: int,
         *,
         max_body_size: int = 2 * 1024 * 1024,
-        chunk_size: int = 4096,
+        chunk_size: int = 64 * 1024,
         encoding: str = "utf-8",
         encoding_errors: EncodingErrors = "strict",
     ) -> None:
@@ -68,7 +164,7 @@ class MultipartParser:
             content_type: The Content-Type header value.
             content_length: The Content-Length of the request body.
             max_body_size: Maximum allowed request body size in bytes (default: 2MB).
-            chunk_size: Size of chunks to read at a time (default: 4KB).
+            chunk_size: Size of chunks to read at a time (default: 64KB).
             encoding: Text encoding for form data (default: "utf-8").
             encoding_errors: How to handle encoding errors (default: "strict").
         """
@@ -87,7 +183,7 @@ class MultipartParser:
         self._encoding_errors = encoding_errors
 
         self._cfield: dict[str, str] = {}
-        self._ccontent = b""
+        self._ccontent = bytearray()
         self._cstream: None | _TemporaryFileWrapper[bytes] = None
         self._delimiter: DelimiterEnum = DelimiterEnum.UNDEF
         self._total_read = 0
@@ -102,7 +198,7 @@ class MultipartParser:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self._cleanup()
 
-    @property
+    @cached_property
     def boundary(self) -> str:
         """Extract boundary parameter from Content-Type header.
 
@@ -110,7 +206,8 @@ class MultipartParser:
             str: The boundary string.
 
         Raises:
-            HTTPException: If boundary is missing from Content-Type header.
+            HTTPException: If boundary is missing from Content-Type header or
+                is longer than ``MAX_BOUNDARY_LENGTH``.
         """
         message = Message()
         message["Content-Type"] = self._content_type
@@ -122,11 +219,18 @@ class MultipartParser:
                 status_code=400,
             )
 
+        boundary = str(boundary)
+        if len(boundary) > MAX_BOUNDARY_LENGTH:
+            raise HTTPException(
+                "Boundary in Content-Type header is too long",
+                status_code=400,
+            )
+
         charset = message.get_param("charset")
         if charset:
             self._encoding = str(charset)
 
-        return str(boundary)
+        return boundary
 
     @property
     def content_length(self) -> int:
@@ -192,7 +296,7 @@ class MultipartParser:
 
         self._temp_files = []
         self._cfield = {}
-        self._ccontent = b""
+        self._ccontent = bytearray()
         self._cstream = None
         self.forms = {}
         self.files = {}
@@ -225,7 +329,7 @@ class MultipartParser:
             self.forms[name] = content
 
         self._cfield = {}
-        self._ccontent = b""
+        self._ccontent = bytearray()
 
     def _on_fbody_end(self):
         """Handle the end of a file body parsing.
@@ -268,45 +372,66 @@ class MultipartParser:
         Raises:
             HTTPException: If Content-Disposition header is missing.
         """
-        headers = [
-            h.strip().decode(self._encoding, self._encoding_errors)
-            for h in data.split(self._delimiter.value)
-            if h
-        ]
-        message = Message()
+        disposition = content_type = None
 
-        for h in headers:
-            if ":" not in h:
+        # Only the two headers that are used get decoded; the first
+        # occurrence of each wins.
+        for line in data.split(self._delimiter.value):
+            key, sep, value = line.partition(b":")
+            if not sep:
                 continue
-            key, value = h.split(":", 1)
-            message[key] = value.strip()
-
-        if "Content-Disposition" not in message:
+            key = key.strip().lower()
+            if key == _CONTENT_DISPOSITION:
+                if disposition is None:
+                    disposition = value
+            elif key == _CONTENT_TYPE:
+                if content_type is None:
+                    content_type = value
+
+        if disposition is None:
             raise HTTPException(
                 "Missing Content-Disposition header.",
                 status_code=400,
             )
 
-        filename = message.get_param("filename", header="Content-Disposition")
+        encoding, errors = self._encoding, self._encoding_errors
+        params = _header_params(disposition.decode(encoding, errors))
+
+        filename = params.get("filename")
         if filename:
-            self._cfield["filename"] = str(filename)
+            self._cfield["filename"] = filename
+
+        if content_type is not None:
+            content_type = content_type.decode(encoding, errors)
+        self._cfield["content_type"] = _media_type(content_type)
+        self._cfield["name"] = str(params.get("name"))
+
+    def _read_chunk(self, remaining: int) -> bytes:
+        """Read the next chunk of the request body.
+
+        Args:
+            remaining: Number of body bytes not read yet.
 
-        self._cfield["content_type"] = message.get_content_type()
-        self._cfield["name"] = str(
-            message.get_param("name", header="Content-Disposition")
-        )
+        Returns:
+            bytes: Up to ``chunk_size`` bytes, or empty bytes at end of stream.
+
+        Raises:
+            HTTPException: If the body grows beyond the max body size.
+        """
+        chunk = self._stream.read(min(self._chunk_size, remaining))
+        self._total_read += len(chunk)
+        if self._total_read > self._max_body_size:
+            raise HTTPException("Request entity too large", status_code=413)
+        return chunk
 
     def _parse(self):
         boundary = f"--{self.boundary}".encode()
         blength = len(boundary)
-        read = self._stream.read
-        chunk_size = self._chunk_size
         remaining = self.content_length
 
-        buffer: bytes = read(min(chunk_size, remaining))
-        self._total_read += len(buffer)
-        if self._total_read > self._max_body_size:
-            raise HTTPException("Request entity too large", status_code=413)
+        # One growing buffer with a read position: consumed bytes are only
+        # dropped (in a single memmove) right before more data is appended.
+        buffer = bytearray(self._read_chunk(remaining))
         remaining -= len(buffer)
 
         try:
@@ -317,6 +442,7 @@ class MultipartParser:
             ) from e
 
         delimiter = self._delimiter.value
+        dlength = len(delimiter)
         delimiter_double = delimiter * 2
         start_idx = buffer.find(boundary)
 
@@ -325,27 +451,41 @@ class MultipartParser:
                 "Invalid multipart/form-data: boundary not found", status_code=400
             )
 
-        buffer = buffer[start_idx + blength :]
-        if buffer.startswith(delimiter):
-            buffer = buffer[len(delimiter) :]
+        pos = start_idx + blength
+        if buffer.startswith(delimiter, pos):
+            pos += dlength
 
-        while not buffer.startswith(b"--"):
-            header_end_idx = buffer.find(delimiter_double)
+        while True:
+            # A chunk may end right after a boundary, before the "--" that
+            # tells the closing boundary apart from the next part.
+            while len(buffer) - pos < 2 and remaining > 0:
+                chunk = self._read_chunk(remaining)
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                del buffer[:pos]
+                pos = 0
+                buffer += chunk
+            if buffer.startswith(b"--", pos):
+                break
+
+            header_end_idx = buffer.find(delimiter_double, pos)
             while header_end_idx == -1:
                 if remaining <= 0:
                     raise HTTPException(
                         "Invalid multipart/form-data: malformed part headers",
                         status_code=400,
                     )
-                chunk = read(min(chunk_size, remaining))
+                chunk = self._read_chunk(remaining)
                 if not chunk:
                     break
-                self._total_read += len(chunk)
-                if self._total_read > self._max_body_size:
-                    raise HTTPException("Request entity too large", status_code=413)
                 remaining -= len(chunk)
+                del buffer[:pos]
+                pos = 0
+                # Only a terminator straddling the old end needs rescanning.
+                scan_from = max(len(buffer) - len(delimiter_double) + 1, 0)
                 buffer += chunk
-                header_end_idx = buffer.find(delimiter_double)
+                header_end_idx = buffer.find(delimiter_double, scan_from)
 
             if header_end_idx == -1:
                 raise HTTPException(
@@ -353,29 +493,27 @@ class MultipartParser:
                     status_code=400,
                 )
 
-            headers_bytes = buffer[:header_end_idx]
-            buffer = buffer[header_end_idx + len(delimiter_double) :]
-            self._process_headers(headers_bytes)
+            self._process_headers(buffer[pos:header_end_idx])
+            pos = header_end_idx + len(delimiter_double)
 
             is_file = "filename" in self._cfield
             if is_file:
                 self._cstream = self._create_tempfile()
             else:
-                self._ccontent = b""
+                self._ccontent = bytearray()
 
-            next_boundary_idx = buffer.find(boundary)
+            next_boundary_idx = buffer.find(boundary, pos)
             while next_boundary_idx == -1:
-                tail_size = blength + 2
-                if len(buffer) > tail_size:
-                    to_process, buffer = buffer[:-tail_size], buffer[-tail_size:]
-                else:
-                    to_process = b""
-
-                if to_process:
-                    if is_file:
-                        self._cstream.write(to_process)
-                    else:
-                        self._ccontent += to_process
+                # Everything but the short tail that may hold the start of a
+                # boundary is written straight from the buffer.
+                cut = len(buffer) - blength - 2
+                if cut > pos:
+                    with memoryview(buffer)[pos:cut] as part:
+                        if is_file:
+                            self._cstream.write(part)
+                        else:
+                            self._ccontent.extend(part)
+                    pos = cut
 
                 if remaining <= 0:
                     raise HTTPException(
@@ -383,15 +521,15 @@ class MultipartParser:
                         status_code=400,
                     )
 
-                chunk = read(min(chunk_size, remaining))
+                chunk = self._read_chunk(remaining)
                 if not chunk:
                     break
-                self._total_read += len(chunk)
-                if self._total_read > self._max_body_size:
-                    raise HTTPException("Request entity too large", status_code=413)
                 remaining -= len(chunk)
+                del buffer[:pos]
+                pos = 0
+                scan_from = max(len(buffer) - blength + 1, 0)
                 buffer += chunk
-                next_boundary_idx = buffer.find(boundary)
+                next_boundary_idx = buffer.find(boundary, scan_from)
 
             if next_boundary_idx == -1:
                 raise HTTPException(
@@ -399,18 +537,21 @@ class MultipartParser:
                     status_code=400,
                 )
 
-            body_part = buffer[:next_boundary_idx]
-            buffer = buffer[next_boundary_idx + blength :]
-
-            if body_part.endswith(delimiter):
-                body_part = body_part[: -len(delimiter)]
+            # The delimiter before the boundary belongs to the boundary.
+            body_end = next_boundary_idx
+            if buffer.endswith(delimiter, pos, body_end):
+                body_end -= dlength
+            with memoryview(buffer)[pos:body_end] as part:
+                if is_file:
+                    self._cstream.write(part)
+                else:
+                    self._ccontent.extend(part)
 
             if is_file:
-                self._cstream.write(body_part)
                 self._on_fbody_end()
             else:
-                self._ccontent += body_part
                 self._on_body_end()
 
-            if buffer.startswith(delimiter):
-                buffer = buffer[len(delimiter) :]
+            pos = next_boundary_idx + blength
+            if buffer.startswith(delimiter, pos):
+                pos += dlength
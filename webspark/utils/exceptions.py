@@ -35,3 +35,11 @@ class HTTPException(Exception):
         super().__init__(details)
         self.details = details
         self.status_code = status_code or self.DEFAULT_STATUS_CODE
+
+
+# Messages shared by the constant-message miss paths. A new HTTPException is raised
+# each time: a shared instance would have its traceback overwritten by concurrent
+# requests and keep the last request's frames alive.
+ROUTE_NOT_FOUND = "Route not found."
+METHOD_NOT_ALLOWED = "Method not allowed."
+HOST_NOT_ALLOWED = "Host not allowed."
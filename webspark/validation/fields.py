@@ -5,6 +5,7 @@ import uuid
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 from enum import Enum
+from itertools import repeat
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
@@ -18,6 +19,9 @@ from ..constants import UNDEFINED
 from ..utils import HTTPException
 from . import helpers
 
+_fromisoformat = datetime.fromisoformat
+_URL_SCHEME_RE = re.compile(r"([a-z][a-z0-9+.\-]*)://", re.IGNORECASE)
+
 
 class BaseField:
     """Base class for all schema fields, handling validation, conversion, and representation."""
@@ -72,8 +76,24 @@ class BaseField:
         return value
 
     def fail(self, key: str, **kwargs):
-        msg = self.error_messages.get(key, "Invalid value.").format(**kwargs)
-        raise HTTPException({self.name: [msg]}, status_code=400)
+        """Raise a validation error for the given message key.
+
+        Messages are only materialized here, on the failure path. A message may be
+        a format template or a callable factory receiving the same keyword
+        arguments.
+        """
+        msg = self.error_messages.get(key, "Invalid value.")
+        msg = msg(**kwargs) if callable(msg) else msg.format(**kwargs)
+        self._raise(self.name, [msg])
+
+    @staticmethod
+    def _raise(name: str, details: Any):
+        """Raise a 400 HTTPException carrying ``{name: details}``.
+
+        Error details are only built by callers on the failure path, so a
+        successful validation never allocates them.
+        """
+        raise HTTPException({name: details}, status_code=400)
 
     def validate(self, value: Any, data: Any = None) -> Any:
         if value is UNDEFINED:
@@ -120,6 +140,8 @@ class IntegerField(BaseField):
             self.validators.append(helpers.max_value_validator(max_value))
 
     def to_python(self, value: Any) -> int:
+        if type(value) is int:
+            return value
         try:
             return int(value)
         except (ValueError, TypeError):
@@ -235,21 +257,25 @@ class ListField(BaseField):
             self.fail("max_items", max_items=self.max_items)
 
         if self.child:
-            validated = []
-            errors = []
+            validate = self.child.validate
+            result = []
+            append = result.append
+            errors = None
             for i, item in enumerate(value):
                 try:
-                    validated.append(self.child.validate(item, data))
+                    append(validate(item, data))
                 except HTTPException as e:
+                    if errors is None:
+                        errors = []
                     errors.append({i: e.details})
             if errors:
-                raise HTTPException({self.name: errors}, status_code=400)
-            return validated
+                self._raise(self.name, errors)
+            return result
         return value
 
     def to_representation(self, value: list, obj: Any = None) -> list:
         if self.child and value:
-            return [self.child.to_representation(item, obj) for item in value]
+            return list(map(self.child.to_representation, value, repeat(obj)))
         return value
 
 
@@ -273,33 +299,22 @@ class SerializerField(BaseField):
         self.initkwargs = initkwargs or {}
 
     def validate(self, value: Any, data: Any = None):
-        if value is UNDEFINED:
-            return super().validate(value, data)
-
-        if value is None:
+        if value is UNDEFINED or value is None:
             return super().validate(value, data)
 
         if self.many:
             if not isinstance(value, list):
                 self.fail("invalid_list")
-            validated_data = []
-            errors = {}
-            for i, item in enumerate(value):
-                try:
-                    serializer = self.serializer_class(data=item, **self.initkwargs)
-                    if serializer.is_valid():
-                        validated_data.append(serializer.validated_data)
-                    else:
-                        errors[str(i)] = serializer.errors
-                except HTTPException as e:
-                    errors[str(i)] = e.details
+            validated_data, errors = self.serializer_class.validate_many(
+                value, **self.initkwargs
+            )
             if errors:
-                raise HTTPException({self.name: errors}, status_code=400)
+                self._raise(self.name, errors)
             return validated_data
 
         serializer = self.serializer_class(data=value, **self.initkwargs)
         if not serializer.is_valid():
-            raise HTTPException({self.name: serializer.errors}, status_code=400)
+            self._raise(self.name, serializer.errors)
         return serializer.validated_data
 
     def to_representation(self, value: Any, obj: Any = None):
@@ -323,20 +338,21 @@ class DateTimeField(BaseField):
         self.auto_now_add = auto_now_add
 
     def to_python(self, value: Any) -> datetime:
+        if type(value) is datetime:
+            return value
+        if isinstance(value, str):
+            try:
+                return _fromisoformat(value)
+            except ValueError:
+                self.fail("invalid")
         if isinstance(value, datetime):
             return value
-        try:
-            return datetime.fromisoformat(value)
-        except (ValueError, TypeError):
-            self.fail("invalid")
+        self.fail("invalid")
 
     def validate(self, value: Any, data: Any = None) -> datetime:
         if self.auto_now or (self.auto_now_add and value is UNDEFINED):
             return datetime.now(tz=timezone.utc)
 
-        if value is UNDEFINED:
-            return super().validate(value, data)
-
         return super().validate(value, data)
 
 
@@ -348,7 +364,16 @@ class UUIDField(BaseField):
     }
 
     def to_python(self, value: Any) -> uuid.UUID:
+        if isinstance(value, uuid.UUID):
+            return value
         try:
+            if (
+                type(value) is str
+                and len(value) == 36
+                and value[8] == value[13] == value[18] == value[23] == "-"
+                and value.count("-") == 4
+            ):
+                return uuid.UUID(int=int(value.replace("-", ""), 16))
             return uuid.UUID(str(value))
         except (ValueError, TypeError):
             self.fail("invalid")
@@ -368,11 +393,17 @@ class URLField(StringField):
 
     def to_python(self, value: Any) -> str:
         value = super().to_python(value)
-        parsed = urlparse(value)
-        if not all([parsed.scheme, parsed.netloc]):
+        match_ = _URL_SCHEME_RE.match(value)
+        if not match_:
             self.fail("invalid")
-        if self.schemes and parsed.scheme not in self.schemes:
+        if self.schemes and match_.group(1).lower() not in self.schemes:
             self.fail("scheme", schemes=self.schemes)
+        try:
+            netloc = urlparse(value).netloc
+        except ValueError:
+            netloc = None
+        if not netloc:
+            self.fail("invalid")
         return value
 
 
@@ -388,11 +419,25 @@ class EnumField(BaseField):
         if isinstance(enum, type) and issubclass(enum, Enum):
             self.enum_type = enum
             self.choices = [e.value for e in enum]
+            members = list(enum)
         else:
             self.enum_type = None
             self.choices = list(enum)
+            members = self.choices
+
+        try:
+            self._lookup = dict(zip(self.choices, members, strict=True))
+        except TypeError:
+            # Unhashable choices fall back to a linear scan.
+            self._lookup = None
 
     def to_python(self, value: Any) -> Any:
+        if self._lookup is not None:
+            try:
+                return self._lookup[value]
+            except (KeyError, TypeError):
+                self.fail("invalid_choice", choices=self.choices)
+
         if value not in self.choices:
             self.fail("invalid_choice", choices=self.choices)
         return self.enum_type(value) if self.enum_type else value
@@ -413,20 +458,27 @@ class DecimalField(BaseField):
         self.decimal_places = decimal_places
 
     def to_python(self, value: Any) -> Decimal:
+        value_type = type(value)
+        if value_type is Decimal:
+            return value
         try:
+            if value_type is str or value_type is int:
+                return Decimal(value)
+            # Floats keep going through str() so 0.1 maps to Decimal("0.1").
             return Decimal(str(value))
         except (InvalidOperation, TypeError):
             self.fail("invalid")
 
     def validate(self, value: Any, data: Any = None) -> Decimal:
         value = super().validate(value, data)
-        if value is None:
+        if value is None or (self.max_digits is None and self.decimal_places is None):
             return value
+        digits_tuple = value.as_tuple()
         if self.max_digits is not None:
-            if len(value.as_tuple().digits) > self.max_digits:
+            if len(digits_tuple.digits) > self.max_digits:
                 self.fail("max_digits", max_digits=self.max_digits)
         if self.decimal_places is not None:
-            if value.as_tuple().exponent < -self.decimal_places:
+            if digits_tuple.exponent < -self.decimal_places:
                 self.fail("decimal_places", decimal_places=self.decimal_places)
         return value
 
@@ -1,13 +1,56 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
+from itertools import chain
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import Any
 
 from ..constants import UNDEFINED
 from ..utils import HTTPException
-from .fields import BaseField
+from .fields import BaseField, MethodField
+
+
+def _compile_representation(field_plan: tuple) -> Callable[[Schema, Any], dict]:
+    """Generate a function building the representation of an object in one dict literal.
+
+    Fields that do not override ``to_representation`` are inlined as ``getattr``
+    reads defaulting to None, matching ``obj.get`` on Mappings; every other field
+    is called through its ``to_representation`` method.
+
+    Args:
+        field_plan: The ``(field_name, source_name, field)`` entries of the schema.
+
+    Returns:
+        A function ``(schema, obj) -> dict``.
+    """
+    namespace = {}
+    prelude = []
+    items = []
+
+    for i, (field_name, source_name, field) in enumerate(field_plan):
+        ref = f"f{i}"
+        namespace[ref] = field
+
+        # Missing attributes read as None, like missing keys of a Mapping.
+        value = f"getattr(obj, {source_name!r}, None)"
+
+        if isinstance(field, MethodField):
+            prelude.append(f"    {ref}.schema = schema")
+            value = f"{ref}.to_representation(None, obj)"
+        elif type(field).to_representation is not BaseField.to_representation:
+            value = f"{ref}.to_representation({value}, obj)"
+
+        items.append(f"        {field_name!r}: {value},")
+
+    source = "\n".join(
+        ["def _fast_repr(schema, obj):", *prelude, "    return {", *items, "    }"]
+    )
+    exec(source, namespace)
+    return namespace["_fast_repr"]
 
 
 class SchemaMeta(type):
@@ -16,6 +59,11 @@ class SchemaMeta(type):
     def __new__(cls, name, bases, attrs):
         """Create a new Schema class with declared fields.
 
+        Fields are bound once here and exposed through a read-only mapping that is
+        shared by every instance of the class. A flat ``_field_plan`` tuple of
+        ``(field_name, source_name, field)`` entries and a compiled representation
+        function are also stored on the class.
+
         Args:
             name: The name of the class being created.
             bases: The base classes of the class being created.
@@ -24,17 +72,31 @@ class SchemaMeta(type):
         Returns:
             The newly created class.
         """
-        declared_fields = {}
-        for base in bases:
-            if hasattr(base, "_declared_fields"):
-                declared_fields.update(base._declared_fields)
-
-        for key, value in attrs.items():
-            if isinstance(value, BaseField):
-                declared_fields[key] = value
-                value.bind(key)
-
-        attrs["_declared_fields"] = declared_fields
+        own_fields = [
+            (key, value) for key, value in attrs.items() if isinstance(value, BaseField)
+        ]
+        for key, value in own_fields:
+            value.bind(key)
+
+        declared_fields = dict(
+            chain(
+                *(
+                    base._declared_fields.items()
+                    for base in bases
+                    if hasattr(base, "_declared_fields")
+                ),
+                own_fields,
+            )
+        )
+
+        attrs["_declared_fields"] = MappingProxyType(declared_fields)
+        attrs["_field_plan"] = tuple(
+            (field_name, field.name, field)
+            for field_name, field in declared_fields.items()
+        )
+        attrs["_fast_repr"] = staticmethod(
+            _compile_representation(attrs["_field_plan"])
+        )
         return super().__new__(cls, name, bases, attrs)
 
 
@@ -74,7 +136,7 @@ class Schema(metaclass=SchemaMeta):
         self.partial = partial
         self.initial_data = data or {}
         self.context = context or {}
-        self.fields: dict[str, BaseField] = self._declared_fields
+        self.fields: Mapping[str, BaseField] = self._declared_fields
 
     @property
     def validated_data(self) -> dict:
@@ -97,6 +159,71 @@ class Schema(metaclass=SchemaMeta):
         """Get validation errors."""
         return self._errors
 
+    @classmethod
+    def serialize(cls, obj: Any, many: bool = False, **initkwargs) -> Any:
+        """Serialize an object, or a list of objects, to primitive data.
+
+        Args:
+            obj: The object (or list of objects when many=True) to serialize.
+            many: Whether obj is a list of objects.
+            **initkwargs: Keyword arguments forwarded to the Schema constructor.
+
+        Returns:
+            A dict, or a list of dicts when many=True.
+        """
+        schema = cls(**initkwargs)
+        if many:
+            return [schema.to_representation(item) for item in obj]
+        return schema.to_representation(obj)
+
+    def to_representation(self, obj: Any) -> dict:
+        """Build the representation of a single object.
+
+        Mappings are read with ``obj.get``. Any other object goes through the
+        function compiled for the schema class, reading fields as attributes.
+
+        Args:
+            obj: The object to represent.
+
+        Returns:
+            A dict mapping field names to their represented values.
+        """
+        if isinstance(obj, Mapping):
+            data = {}
+            for field_name, source_name, field in self._field_plan:
+                field.schema = self
+                data[field_name] = field.to_representation(obj.get(source_name), obj)
+            return data
+        return self._fast_repr(self, obj)
+
+    @classmethod
+    def validate_many(cls, items: list, **initkwargs) -> tuple[list, dict]:
+        """Validate a list of items reusing a single schema instance.
+
+        Args:
+            items: The list of items to validate.
+            **initkwargs: Keyword arguments forwarded to the Schema constructor.
+
+        Returns:
+            A tuple of (validated_items, errors), where errors maps the string
+            index of each invalid item to its validation errors.
+        """
+        schema = cls(**initkwargs)
+        validated_items = []
+        errors = {}
+
+        for i, item in enumerate(items):
+            schema.initial_data = item or {}
+            try:
+                if schema.is_valid():
+                    validated_items.append(schema._validated_data)
+                else:
+                    errors[str(i)] = schema._errors
+            except HTTPException as e:
+                errors[str(i)] = e.details
+
+        return validated_items, errors
+
     def validate(self, data: Any):
         """Override this method to add custom validation.
 
@@ -119,7 +246,7 @@ class Schema(metaclass=SchemaMeta):
             return False
 
         validated_data = {}
-        errors = {}
+        errors = None
 
         try:
             initial_data = self.validate(
@@ -130,12 +257,15 @@ class Schema(metaclass=SchemaMeta):
             self._validated_data = validated_data
             return False
 
-        for field_name, field in self.fields.items():
-            source_name = field.name
-            raw_value = initial_data.get(source_name, UNDEFINED)
+        get = initial_data.get
+        undefined = UNDEFINED
+        partial = self.partial
 
-            if raw_value in (UNDEFINED, None):
-                if raw_value is UNDEFINED and self.partial:
+        for field_name, source_name, field in self._field_plan:
+            raw_value = get(source_name, undefined)
+
+            if raw_value is undefined or raw_value is None:
+                if raw_value is undefined and partial:
                     continue
 
                 if field.default is not None:
@@ -146,12 +276,15 @@ class Schema(metaclass=SchemaMeta):
                 validated_value = field.validate(raw_value, initial_data)
                 validated_data[field_name] = validated_value
             except HTTPException as e:
+                if errors is None:
+                    errors = {}
                 errors.update(e.details)
 
-        if errors:
+        if errors is not None:
             self._errors = errors
             self._validated_data = validated_data
             return False
 
+        self._errors = {}
         self._validated_data = validated_data
         return True